@@ -1,6 +1,7 @@
 -- Path of Building API Bridge
 -- Runs as: cd src && LUA_PATH="../runtime/lua/?.lua;../runtime/lua/?/init.lua;;" luajit ../api/lua/bridge.lua
--- Communicates via JSON-line protocol over stdin/stdout
+-- Communicates over stdin/stdout: length-prefixed frames when started by the
+-- Python bridge (POB_BRIDGE_PROTOCOL=framed), JSON lines otherwise
 -- stderr is used for logging (ConPrintf redirected there)
 
 -- ============================================================================
@@ -554,20 +555,89 @@ local function jsonDecode(str)
 	return dkjson.decode(str)
 end
 
+-- ============================================================================
+-- Wire protocol
+-- ============================================================================
+
+-- The Python bridge sets POB_BRIDGE_PROTOCOL=framed: every message is a 4-byte
+-- little-endian payload length followed by the payload. Without it we fall back
+-- to newline-delimited JSON so the bridge can still be driven by hand.
+local framed = os.getenv("POB_BRIDGE_PROTOCOL") == "framed"
+
+-- MessagePack is used when the parent asks for it and a Lua implementation
+-- (lua-cmsgpack or lua-MessagePack) is installed; JSON otherwise. The ready
+-- message is always JSON and tells the parent which codec was picked.
+local wire = { codec = "json", encode = dkjson.encode, decode = jsonDecode }
+if framed and os.getenv("POB_BRIDGE_CODEC") == "msgpack" then
+	for _, modName in ipairs({ "cmsgpack", "MessagePack" }) do
+		local ok, mod = pcall(l_require, modName)
+		if ok and type(mod) == "table" and mod.pack and mod.unpack then
+			wire.codec = "msgpack"
+			wire.encode = mod.pack
+			wire.decode = mod.unpack
+			break
+		end
+	end
+end
+
+-- Frames are binary, so stop the Windows CRT from translating line endings
+if framed and isWindows then
+	local ffiOk, ffi = pcall(l_require, "ffi")
+	if ffiOk then
+		ffi.cdef("int _setmode(int fd, int mode);")
+		ffi.C._setmode(0, 0x8000) -- _O_BINARY on stdin
+		ffi.C._setmode(1, 0x8000) -- _O_BINARY on stdout
+	end
+end
+
+local function writeMessage(payload)
+	if framed then
+		local n = #payload
+		io.stdout:write(string.char(n % 256, math.floor(n / 256) % 256,
+			math.floor(n / 65536) % 256, math.floor(n / 16777216) % 256), payload)
+	else
+		io.stdout:write(payload, "\n")
+	end
+	io.stdout:flush()
+end
+
+-- Returns the next raw request payload, "" for a blank line, or nil on EOF
+local function readMessage()
+	if not framed then
+		return io.stdin:read("*l")
+	end
+	local header = io.stdin:read(4)
+	if not header or #header < 4 then
+		return nil
+	end
+	local b1, b2, b3, b4 = header:byte(1, 4)
+	local n = b1 + b2 * 256 + b3 * 65536 + b4 * 16777216
+	if n == 0 then
+		return ""
+	end
+	local payload = io.stdin:read(n)
+	if not payload or #payload < n then
+		return nil
+	end
+	return payload
+end
+
 -- ============================================================================
 -- Response helpers
 -- ============================================================================
 
 local function respond(result)
-	local json = dkjson.encode({ ok = true, result = result })
-	io.stdout:write(json .. "\n")
-	io.stdout:flush()
+	writeMessage(wire.encode({ ok = true, result = result }))
 end
 
 local function respondError(msg)
-	local json = dkjson.encode({ ok = false, error = tostring(msg) })
-	io.stdout:write(json .. "\n")
-	io.stdout:flush()
+	writeMessage(wire.encode({ ok = false, error = tostring(msg) }))
+end
+
+-- Streamed commands may send any number of chunks before returning; the
+-- parent treats the command's normal response as the end of the stream.
+local function respondChunk(chunk)
+	writeMessage(wire.encode({ ok = true, chunk = chunk }))
 end
 
 -- ============================================================================
@@ -700,10 +770,20 @@ function commands.new_build(params)
 end
 
 function commands.load_build_xml(params)
-	if not params.xml then
+	local xmlText = params.xml
+	-- Large builds may be handed over in a temp file instead of inline
+	if not xmlText and params.xml_path then
+		local file = io.open(params.xml_path, "rb")
+		if not file then
+			error("Cannot open XML file: " .. tostring(params.xml_path))
+		end
+		xmlText = file:read("*a")
+		file:close()
+	end
+	if not xmlText then
 		error("Missing 'xml' parameter")
 	end
-	loadBuildFromXML(params.xml, params.name)
+	loadBuildFromXML(xmlText, params.name)
 	return { success = true }
 end
 
@@ -747,6 +827,16 @@ function commands.get_build_xml(params)
 		error("No build loaded")
 	end
 	local xmlText = build:SaveDB("export")
+	-- Write to the caller's file instead of sending the XML inline
+	if params.spill_path then
+		local file = io.open(params.spill_path, "wb")
+		if not file then
+			error("Cannot write XML file: " .. tostring(params.spill_path))
+		end
+		file:write(xmlText)
+		file:close()
+		return { path = params.spill_path }
+	end
 	return { xml = xmlText }
 end
 
@@ -791,22 +881,47 @@ function commands.dealloc_node(params)
 	return { success = true }
 end
 
+local function allocNodeEntry(id, node)
+	return {
+		id = id,
+		name = node.dn or node.name,
+		type = node.type,
+		ascendancyName = node.ascendancyName,
+	}
+end
+
 function commands.list_alloc_nodes(params)
 	if not build or not build.spec then
 		error("No build loaded")
 	end
 	local nodes = {}
 	for id, node in pairs(build.spec.allocNodes) do
-		table.insert(nodes, {
-			id = id,
-			name = node.dn or node.name,
-			type = node.type,
-			ascendancyName = node.ascendancyName,
-		})
+		table.insert(nodes, allocNodeEntry(id, node))
 	end
 	return { nodes = nodes }
 end
 
+-- Same data as list_alloc_nodes, sent as pages of at most page_size nodes
+function commands.list_alloc_nodes_stream(params)
+	if not build or not build.spec then
+		error("No build loaded")
+	end
+	local pageSize = tonumber(params.page_size) or 256
+	local page, count = {}, 0
+	for id, node in pairs(build.spec.allocNodes) do
+		page[#page + 1] = allocNodeEntry(id, node)
+		count = count + 1
+		if #page >= pageSize then
+			respondChunk({ nodes = page })
+			page = {}
+		end
+	end
+	if #page > 0 then
+		respondChunk({ nodes = page })
+	end
+	return { count = count }
+end
+
 function commands.search_nodes(params)
 	if not build or not build.spec then
 		error("No build loaded")
@@ -1598,6 +1713,38 @@ function commands.get_full_output(params)
 	return safeSerialize(output, 0) or {}
 end
 
+-- Same data as get_full_output, sent as chunks of at most chunk_size stats
+function commands.get_full_output_stream(params)
+	if not build or not build.calcsTab then
+		error("No build loaded")
+	end
+	local output = build.calcsTab.mainOutput
+	if not output then
+		error("No calculation output available")
+	end
+	local chunkSize = tonumber(params.chunk_size) or 256
+	local chunk, count, chunks = {}, 0, 0
+	for k, v in pairs(output) do
+		if type(k) == "string" or type(k) == "number" then
+			local sv = safeSerialize(v, 1)
+			if sv ~= nil then
+				chunk[tostring(k)] = sv
+				count = count + 1
+				if count >= chunkSize then
+					respondChunk(chunk)
+					chunks = chunks + 1
+					chunk, count = {}, 0
+				end
+			end
+		end
+	end
+	if count > 0 then
+		respondChunk(chunk)
+		chunks = chunks + 1
+	end
+	return { chunks = chunks }
+end
+
 function commands.get_stat(params)
 	if not build or not build.calcsTab then
 		error("No build loaded")
@@ -2801,6 +2948,48 @@ function commands.simulate_item(params)
 	}
 end
 
+-- ============================================================================
+-- Batched commands
+-- ============================================================================
+
+-- Commands that write their own frames or end the process can't run inside
+-- a batch, since the batch answers with exactly one response.
+local UNBATCHABLE = {
+	call_many = true,
+	shutdown = true,
+	get_full_output_stream = true,
+	list_alloc_nodes_stream = true,
+}
+
+function commands.call_many(params)
+	local requests = params.commands
+	if type(requests) ~= "table" then
+		error("Missing 'commands' parameter")
+	end
+	local results = {}
+	for i, request in ipairs(requests) do
+		local cmd = type(request) == "table" and request.command or nil
+		local handler = cmd and not UNBATCHABLE[cmd] and commands[cmd]
+		local execOk, result
+		if not cmd then
+			execOk, result = false, "Missing 'command' field"
+		elseif not handler then
+			execOk, result = false, (UNBATCHABLE[cmd] and "Command can't be batched: " or "Unknown command: ") .. tostring(cmd)
+		else
+			execOk, result = pcall(handler, request.params or {})
+		end
+		if execOk then
+			results[i] = { ok = true, result = result }
+		else
+			results[i] = { ok = false, error = tostring(result) }
+			if params.stop_on_error then
+				break
+			end
+		end
+	end
+	return { results = results }
+end
+
 function commands.shutdown(params)
 	respond({ success = true, message = "Shutting down" })
 	os.exit(0)
@@ -2810,31 +2999,30 @@ end
 -- Signal ready
 -- ============================================================================
 
-ConPrintf("Bridge: Initialization complete, entering command loop")
-io.stdout:write(dkjson.encode({ ready = true }) .. "\n")
-io.stdout:flush()
+ConPrintf("Bridge: Initialization complete, entering command loop (codec: %s)", wire.codec)
+writeMessage(dkjson.encode({ ready = true, codec = wire.codec }))
 
 -- ============================================================================
 -- Main read-eval-respond loop
 -- ============================================================================
 
 while true do
-	local line = io.stdin:read("*l")
-	if not line then
+	local message = readMessage()
+	if not message then
 		-- EOF: parent process closed stdin
 		ConPrintf("Bridge: stdin closed, exiting")
 		break
 	end
 
-	-- Skip empty lines
-	if line:match("^%s*$") then
+	-- Skip empty messages
+	if message:match("^%s*$") then
 		goto continue
 	end
 
-	-- Parse the JSON request
-	local ok, request = pcall(jsonDecode, line)
+	-- Decode the request
+	local ok, request = pcall(wire.decode, message)
 	if not ok or type(request) ~= "table" then
-		respondError("Invalid JSON: " .. tostring(request))
+		respondError("Invalid request: " .. tostring(request))
 		goto continue
 	end
 
@@ -2853,7 +3041,14 @@ while true do
 	-- Execute the command with error handling
 	local execOk, result = pcall(handler, request.params or {})
 	if execOk then
-		respond(result)
+		-- Callers that only need the status or one field can skip the rest
+		if request.quiet then
+			respond(nil)
+		elseif request.field and type(result) == "table" then
+			respond({ [request.field] = result[request.field] })
+		else
+			respond(result)
+		end
 	else
 		respondError(tostring(result))
 	end
@@ -5,13 +5,14 @@ compared or switched without reloading. Evicts the least-recently-used build
 when the pool reaches capacity.
 """
 
+import contextlib
 import logging
 import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .config import BRIDGE_POOL_MAX_BUILDS
-from .lua_bridge import LuaBridge, LuaBridgeError
+from .lua_bridge import READ_ONLY_COMMANDS, LuaBridge, LuaBridgeError
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,13 @@ class LuaBridgePool:
         self._active: str | None = None
         self._lru: list[str] = []          # index 0 = least recently used
         self._lock = threading.Lock()
+        # Started bridge with an empty new build, not yet tied to a pool
+        # entry: not listed, never active, and taken over by the next load_build
+        self._spare: LuaBridge | None = None
+        # Serializes spare creation; the spare is only published once ready
+        self._spare_lock = threading.Lock()
+        # Serializes bootstrapping so concurrent callers share one bridge
+        self._bootstrap_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Pool management
@@ -41,11 +49,12 @@ class LuaBridgePool:
         path: str | None = None,
         xml: str | None = None,
         new: bool = False,
-    ) -> None:
+    ) -> dict[str, Any]:
         """Load a build into its own bridge instance and make it active.
 
         If the build is already loaded, just switches to it.
         Evicts the least-recently-used build when the pool is full.
+        Returns the build's get_build_info result.
 
         Args:
             name: Unique key for this build within the pool.
@@ -59,37 +68,61 @@ class LuaBridgePool:
             raise LuaBridgeError("Either 'path', 'xml', or new=True must be provided")
 
         with self._lock:
-            if name in self._builds:
+            existing = self._builds.get(name)
+            if existing is not None:
                 self._set_active_locked(name)
-                return
-
-            # Evict LRU if at capacity
-            if len(self._builds) >= self._max_builds:
-                evict = self._lru.pop(0)
-                logger.info("Pool full — evicting build '%s'", evict)
-                self._builds[evict].shutdown()
-                del self._builds[evict]
-                if self._active == evict:
-                    self._active = None
-
-            # Spin up a new bridge for this build
-            bridge = LuaBridge()
-
-        # Start the bridge outside the lock — startup is slow (~1-2 s)
-        bridge.start()
-
-        if new:
-            bridge.send_command("new_build")
-        elif path is not None:
-            bridge.send_command("load_build_file", {"path": path})
-        else:
-            bridge.send_command("load_build_xml", {"xml": xml, "name": name})
+            else:
+                # Evict LRU if at capacity
+                if len(self._builds) >= self._max_builds:
+                    evict = self._lru.pop(0)
+                    logger.info("Pool full — evicting build '%s'", evict)
+                    self._builds[evict].shutdown()
+                    del self._builds[evict]
+                    if self._active == evict:
+                        self._active = None
+
+                # Take over the spare bridge if there is one, else spin up
+                # a new bridge for this build
+                bridge = self._spare or LuaBridge()
+                self._spare = None
+
+        if existing is not None:
+            return existing.send_command("get_build_info")
+
+        # The bridge only joins the pool once the build has loaded; on any
+        # failure its process is shut down rather than left running
+        try:
+            # Start the bridge outside the lock — startup is slow (~1-2 s).
+            # A spare is already running, so this returns immediately.
+            bridge.start()
+
+            with contextlib.ExitStack() as stack:
+                if new:
+                    load = ("new_build", None)
+                elif path is not None:
+                    load = ("load_build_file", {"path": path})
+                else:
+                    xml_params = stack.enter_context(bridge.xml_handoff(xml))
+                    load = ("load_build_xml", {**xml_params, "name": name})
+
+                # Load and describe the build in one round-trip
+                results = bridge.send_many([load, ("get_build_info", None)], stop_on_error=True)
+            for entry in results:
+                if not entry.get("ok"):
+                    raise LuaBridgeError(entry.get("error", "Unknown error"))
+            if len(results) < 2:
+                raise LuaBridgeError("Bridge returned an incomplete load result")
+        except BaseException:
+            bridge.shutdown()
+            raise
 
         with self._lock:
             self._builds[name] = bridge
             self._set_active_locked(name)
             logger.info("Build '%s' loaded (pool size: %d)", name, len(self._builds))
 
+        return results[-1].get("result", {})
+
     def switch_build(self, name: str) -> None:
         """Make a previously-loaded build the active one.
 
@@ -136,6 +169,9 @@ class LuaBridgePool:
         """Gracefully shut down every bridge in the pool."""
         with self._lock:
             items = list(self._builds.items())
+            if self._spare is not None:
+                items.append(("(spare)", self._spare))
+                self._spare = None
             self._builds.clear()
             self._lru.clear()
             self._active = None
@@ -151,6 +187,15 @@ class LuaBridgePool:
     # Command routing
     # ------------------------------------------------------------------
 
+    def get_bridge(self, build_name: str | None = None) -> LuaBridge:
+        """Return the specified or active build's bridge.
+
+        Args:
+            build_name: Target build name; defaults to the active build.
+        """
+        with self._lock:
+            return self._bridge_for_locked(build_name)
+
     def call(
         self,
         command: str,
@@ -165,21 +210,72 @@ class LuaBridgePool:
             build_name: Target build name; defaults to the active build.
         """
         with self._lock:
-            target = build_name or self._active
-            if target is None:
-                raise LuaBridgeError(
-                    "No active build. Load a build first with load_build_file or load_build_xml."
-                )
-            if target not in self._builds:
-                raise LuaBridgeError(f"Build not loaded: '{target}'")
-            bridge = self._builds[target]
-            # Update LRU without popping from the middle repeatedly
-            if self._lru and self._lru[-1] != target:
-                self._lru.remove(target)
-                self._lru.append(target)
+            bridge = self._bridge_for_locked(build_name)
 
         return bridge.send_command(command, params)
 
+    def call_void(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        build_name: str | None = None,
+    ) -> None:
+        """Route a command like call(), for its effect only (no result is sent back).
+
+        Args:
+            command:    Lua bridge command name.
+            params:     Command parameters.
+            build_name: Target build name; defaults to the active build.
+        """
+        self.get_bridge(build_name).send_void(command, params)
+
+    def call_many(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        build_name: str | None = None,
+        stop_on_error: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Route a batch of commands to one build's bridge in a single round-trip.
+
+        Args:
+            commands:      (command, params) pairs, run in order.
+            build_name:    Target build name; defaults to the active build.
+            stop_on_error: Stop at the first failed command.
+        """
+        with self._lock:
+            bridge = self._bridge_for_locked(build_name)
+
+        return bridge.send_many(commands, stop_on_error)
+
+    def export_build_xml(self, build_name: str | None = None) -> str:
+        """Export the specified or active build as PoB XML.
+
+        Args:
+            build_name: Target build name; defaults to the active build.
+        """
+        with self._lock:
+            bridge = self._bridge_for_locked(build_name)
+
+        return bridge.export_build_xml()
+
+    def stream(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        build_name: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Route a streamed command like call(), yielding its chunks.
+
+        Args:
+            command:    Lua bridge command name.
+            params:     Command parameters.
+            build_name: Target build name; defaults to the active build.
+        """
+        with self._lock:
+            bridge = self._bridge_for_locked(build_name)
+
+        return bridge.stream_command(command, params)
+
     def call_any(
         self,
         command: str,
@@ -188,24 +284,96 @@ class LuaBridgePool:
         """Route a command to any available bridge, bootstrapping one if needed.
 
         Use for commands that don't require a loaded build (e.g. list_builds,
-        search_base_items). If no build is loaded, a minimal new-build bridge
-        is started automatically.
+        search_base_items). Commands go to the active build's bridge, or the
+        most recently used one. Read-only commands may instead run on a
+        bridge that isn't busy, so lookups don't queue behind a long
+        calculation; anything else could change the state of whichever
+        build it landed on. If no build is loaded, read-only commands run
+        on the spare bridge (which holds an empty new build) and anything
+        else bootstraps a minimal new-build bridge.
         """
         with self._lock:
-            bridge = self._builds.get(self._lru[-1]) if self._lru else None
+            names = list(reversed(self._lru))
+            if self._active in self._builds:
+                names.remove(self._active)
+                names.insert(0, self._active)
+            bridges = [self._builds[name] for name in names]
+        bridge = bridges[0] if bridges else None
+        read_only = command in READ_ONLY_COMMANDS
+        if read_only:
+            bridge = next((b for b in bridges if not b.is_busy), bridge)
 
         if bridge is None:
-            logger.info("No bridge available — bootstrapping a new-build bridge")
-            self.load_build(name="__bootstrap__", new=True)
-            with self._lock:
-                bridge = self._builds["__bootstrap__"]
+            # Lookups can run on the spare without making it a build; a
+            # command that may change state gets a real (bootstrap) build
+            bridge = self._spare_bridge() if read_only else self._bootstrap()
 
         return bridge.send_command(command, params)
 
+    def warm(self) -> None:
+        """Start a spare bridge ahead of the first call if none is running yet.
+
+        Bridge startup parses PoB's data files, which can take many seconds;
+        warming at server start keeps that out of the first tool call. The
+        spare holds an empty new build, so build-independent lookups can run
+        on it, but it isn't listed or active; the next load_build takes it over.
+        """
+        with self._lock:
+            if self._builds:
+                return
+        self._spare_bridge()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _spare_bridge(self) -> LuaBridge:
+        """Return the spare bridge, creating it if needed.
+
+        A new spare is started and given an empty new build — lookups over
+        game data need build.data — before load_build can take it over.
+        """
+        with self._spare_lock:
+            with self._lock:
+                if self._spare is not None:
+                    return self._spare
+            bridge = LuaBridge()
+            try:
+                bridge.start()
+                bridge.send_void("new_build")
+            except BaseException:
+                bridge.shutdown()
+                raise
+            with self._lock:
+                self._spare = bridge
+            return bridge
+
+    def _bootstrap(self) -> LuaBridge:
+        """Return the MRU bridge, starting a new-build bridge if the pool is empty."""
+        with self._bootstrap_lock:
+            with self._lock:
+                if self._lru:
+                    return self._builds[self._lru[-1]]
+            logger.info("No bridge available — bootstrapping a new-build bridge")
+            self.load_build(name="__bootstrap__", new=True)
+            with self._lock:
+                return self._builds["__bootstrap__"]
+
+    def _bridge_for_locked(self, build_name: str | None) -> LuaBridge:
+        """Resolve the target build's bridge and mark it MRU. Caller holds lock."""
+        target = build_name or self._active
+        if target is None:
+            raise LuaBridgeError(
+                "No active build. Load a build first with load_build_file or load_build_xml."
+            )
+        if target not in self._builds:
+            raise LuaBridgeError(f"Build not loaded: '{target}'")
+        # Update LRU without popping from the middle repeatedly
+        if self._lru and self._lru[-1] != target:
+            self._lru.remove(target)
+            self._lru.append(target)
+        return self._builds[target]
+
     def _set_active_locked(self, name: str) -> None:
         """Set active build and move to MRU end of LRU list. Caller holds lock."""
         self._active = name
@@ -0,0 +1,45 @@
+"""Small thread-safe LRU cache for bridge results."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """Mapping with a size bound that evicts the least-recently-used entry.
+
+    All methods are thread-safe; values are stored as-is, so callers must not
+    mutate what they get back.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key (marking it recent), or default."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
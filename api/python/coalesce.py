@@ -0,0 +1,119 @@
+"""Coalescing of concurrent get_output calls into shared bridge round-trips."""
+
+import threading
+from typing import Any, Callable
+
+from .lua_bridge import LuaBridge, LuaBridgeError
+
+
+class _Waiter:
+    __slots__ = ("stats", "event", "lead", "result", "error")
+
+    def __init__(self, stats: list[str] | None):
+        self.stats = stats
+        self.event = threading.Event()
+        self.lead = False
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+class OutputCoalescer:
+    """Merges get_output requests that overlap in time into one round-trip.
+
+    The first caller sends its request straight away. Callers arriving while
+    that is in flight queue up, and once it returns the oldest of them sends
+    the whole queue at once: explicit stat lists are unioned into a single
+    get_output, and curated (no stats) requests share one call, batched
+    together with the union when both are waiting. Each caller gets back
+    only the stats it asked for. A lone caller never waits on a timer.
+
+    Thread-safe; meant for sync request handlers running in a threadpool.
+    """
+
+    def __init__(self, get_bridge: Callable[[], LuaBridge]):
+        self._get_bridge = get_bridge
+        self._lock = threading.Lock()
+        self._pending: list[_Waiter] = []
+        self._busy = False
+
+    def get_output(self, stats: list[str] | None = None) -> dict[str, Any]:
+        """Return get_output for ``stats`` (curated stats when None)."""
+        waiter = _Waiter(stats)
+        with self._lock:
+            self._pending.append(waiter)
+            if not self._busy:
+                self._busy = True
+                waiter.lead = True
+
+        if not waiter.lead:
+            # Woken either with our result or to lead the next batch
+            waiter.event.wait()
+
+        if waiter.lead:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            try:
+                self._run(batch)
+            finally:
+                with self._lock:
+                    if self._pending:
+                        self._pending[0].lead = True
+                        self._pending[0].event.set()
+                    else:
+                        self._busy = False
+
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.result
+
+    def _run(self, batch: list[_Waiter]) -> None:
+        """Send one round-trip for the batch and hand each waiter its result."""
+        curated = [w for w in batch if w.stats is None]
+        explicit = [w for w in batch if w.stats is not None]
+
+        groups: list[tuple[list[_Waiter], dict[str, Any] | None]] = []
+        if curated:
+            groups.append((curated, None))
+        if explicit:
+            union = sorted({key for w in explicit for key in w.stats})
+            groups.append((explicit, {"stats": union}))
+
+        try:
+            bridge = self._get_bridge()
+            if len(groups) == 1:
+                entries = [{"ok": True, "result": bridge.send_command("get_output", groups[0][1])}]
+            else:
+                entries = bridge.send_many([("get_output", params) for _, params in groups])
+        except BaseException as e:
+            for w in batch:
+                w.error = e
+                if not w.lead:
+                    w.event.set()
+            if isinstance(e, Exception):
+                return
+            raise
+
+        for (waiters, params), entry in zip(groups, entries):
+            result = entry.get("result") or {}
+            for w in waiters:
+                if not entry.get("ok"):
+                    w.error = LuaBridgeError(entry.get("error", "Unknown error"))
+                elif params is None or len(waiters) == 1:
+                    w.result = result
+                else:
+                    w.result = _select_stats(result, w.stats)
+                if not w.lead:
+                    w.event.set()
+
+
+def _select_stats(result: dict[str, Any], stats: list[str]) -> dict[str, Any]:
+    """Narrow a unioned get_output result to what one caller requested.
+
+    Minion_* stats and SkillDPS are always part of get_output, so they stay.
+    """
+    wanted = set(stats)
+    return {
+        key: value
+        for key, value in result.items()
+        if key in wanted or key == "SkillDPS" or key.startswith("Minion_")
+    }
@@ -1,9 +1,11 @@
 """Configuration for the PoB API server."""
 
+import functools
 import os
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def get_pob_path() -> Path:
     """Get the Path of Building root directory."""
     env_path = os.environ.get("POB_PATH")
@@ -26,8 +28,26 @@ DEFAULT_PORT = int(os.environ.get("POB_API_PORT", "8000"))
 BRIDGE_STARTUP_TIMEOUT = float(os.environ.get("POB_BRIDGE_STARTUP_TIMEOUT", "30.0"))
 BRIDGE_COMMAND_TIMEOUT = float(os.environ.get("POB_BRIDGE_COMMAND_TIMEOUT", "30.0"))
 
+# Preferred bridge wire codec: "msgpack" (used when both sides support it) or "json"
+BRIDGE_CODEC = (os.environ.get("POB_BRIDGE_CODEC") or "msgpack").strip().lower()
+if BRIDGE_CODEC not in ("msgpack", "json"):
+    raise ValueError(
+        f"POB_BRIDGE_CODEC must be 'msgpack' or 'json', got {os.environ['POB_BRIDGE_CODEC']!r}"
+    )
+
+# Build XML larger than this (in UTF-8 bytes) is passed to the bridge through a
+# temp file rather than inline, when the JSON codec is in use
+XML_HANDOFF_THRESHOLD = int(os.environ.get("POB_XML_HANDOFF_THRESHOLD", "16384"))
+
+# Directory for those temp files; defaults to the system temp dir. Point it at
+# e.g. PoB's src/ when a sandboxed LuaJIT can't read the system temp dir
+XML_HANDOFF_DIR = os.environ.get("POB_XML_HANDOFF_DIR")
+
 # Builds directory path override
 BUILDS_PATH = os.environ.get("POB_BUILDS_PATH")  # Optional override passed to Lua bridge
 
 # Bridge pool
 BRIDGE_POOL_MAX_BUILDS = int(os.environ.get("POB_POOL_MAX_BUILDS", "4"))
+
+# Results of commands over static game data (base items, uniques, modifiers)
+STATIC_CACHE_SIZE = int(os.environ.get("POB_STATIC_CACHE_SIZE", "1024"))
@@ -1,26 +1,136 @@
 """Manages a persistent LuaJIT subprocess running bridge.lua.
 
-Communicates via JSON-line protocol over stdin/stdout of the subprocess.
+Communicates over stdin/stdout of the subprocess using length-prefixed frames:
+each message is a 4-byte little-endian length followed by the payload, encoded
+as MessagePack when both sides support it and JSON otherwise.
 Thread-safe: uses a lock to serialize access (Lua is single-threaded).
 Works on Windows, macOS, and Linux.
 """
 
-import json
+import contextlib
+import io
 import logging
 import os
-import queue
+import selectors
+import struct
 import subprocess
 import sys
+import tempfile
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from .config import BRIDGE_COMMAND_TIMEOUT, BRIDGE_STARTUP_TIMEOUT, get_luajit_path, get_pob_path
+from .config import (
+    BRIDGE_CODEC,
+    BRIDGE_COMMAND_TIMEOUT,
+    BRIDGE_STARTUP_TIMEOUT,
+    XML_HANDOFF_DIR,
+    XML_HANDOFF_THRESHOLD,
+    get_luajit_path,
+    get_pob_path,
+)
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # JSON codec only
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
 IS_WINDOWS = sys.platform == "win32"
 
+# Bridge commands that never change build state. Any other command bumps the
+# bridge's state_version, which callers use to validate cached results.
+READ_ONLY_COMMANDS = frozenset({
+    "ping",
+    "get_build_info", "get_build_xml",
+    "list_alloc_nodes", "list_alloc_nodes_stream", "search_nodes", "get_node_info",
+    "list_items", "get_item_details", "dump_item_fields",
+    "get_all_equipped_items", "list_slots", "list_skills",
+    "get_output", "get_full_output", "get_full_output_stream",
+    "get_stat", "get_stats_list", "get_minion_stats", "check_flag",
+    "search_modifiers", "get_modifier_tiers", "get_modifiers_for_item_type",
+    "get_modifier_types", "get_item_modifier_tags", "search_item_types",
+    "search_base_items", "get_base_item_types", "get_base_item_details",
+    "search_unique_items", "get_unique_item_details",
+    "list_config_options", "get_builds_path", "list_builds",
+})
+
+
+def _is_read_only(command: str, params: dict[str, Any] | None) -> bool:
+    """Whether a request can't change build state; a batch is if all its commands are."""
+    if command == "call_many":
+        batch = (params or {}).get("commands") or ()
+        return all(
+            isinstance(entry, dict) and entry.get("command") in READ_ONLY_COMMANDS
+            for entry in batch
+        )
+    return command in READ_ONLY_COMMANDS
+
+
+def _merge_params(params: dict[str, Any] | None, kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Combine a params dict with keyword-argument params (keywords win)."""
+    if not kwargs:
+        return params
+    return {**params, **kwargs} if params else kwargs
+
+
+# 4-byte little-endian payload length preceding every frame
+_FRAME_HEADER = struct.Struct("<I")
+
+# Bytes requested per read from the bridge's stdout
+_READ_CHUNK = 65536
+
+
+def json_default(obj: Any) -> Any:
+    """Encode the few non-JSON types that turn up in params and results."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_encode(obj: Any) -> bytes:
+    # Non-string keys match what json.dumps() did with them
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_decode(buf: bytes) -> Any:
+    return orjson.loads(buf)
+
+
+def _msgpack_decode(buf: bytes) -> Any:
+    # Lua tables with numeric keys arrive as integer-keyed maps, and Lua
+    # strings are raw bytes that are not guaranteed to be valid UTF-8.
+    return msgpack.unpackb(buf, raw=False, strict_map_key=False, unicode_errors="replace")
+
+
+@contextlib.contextmanager
+def _temp_xml_path(directory: str | Path) -> Iterator[str | None]:
+    """Reserve a temp file path in ``directory`` for handing build XML to or from the bridge.
+
+    Yields None if the file can't be created, so callers can fall back to
+    passing the XML inline.
+    """
+    try:
+        fd, path = tempfile.mkstemp(prefix="pob-build-", suffix=".xml", dir=directory)
+    except OSError as e:
+        logger.warning("Cannot create XML hand-off file in %s (%s); sending XML inline", directory, e)
+        path = None
+    else:
+        os.close(fd)
+    try:
+        yield path
+    finally:
+        if path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+
 
 class LuaBridgeError(Exception):
     """Raised when the Lua bridge returns an error."""
@@ -40,26 +150,52 @@ class LuaBridge:
     ):
         self._pob_path = Path(pob_path) if pob_path else get_pob_path()
         self._luajit_path = luajit_path or get_luajit_path()
+        self._src_dir = self._pob_path / "src"
+        self._bridge_script = self._pob_path / "api" / "lua" / "bridge.lua"
+        # XML hand-off files go in the system temp dir unless configured
+        # otherwise (e.g. PoB's src/ for a sandboxed LuaJIT)
+        self._handoff_dir = Path(XML_HANDOFF_DIR or tempfile.gettempdir())
         self._lock = threading.Lock()
+        # Held while the subprocess is being started, so concurrent first
+        # calls don't each launch one
+        self._start_lock = threading.Lock()
         self._process: subprocess.Popen | None = None
+        self._stdin: io.BufferedWriter | None = None
         self._stderr_thread: threading.Thread | None = None
+        # POSIX only: waits for stdout to become readable, registered once
+        self._selector: selectors.BaseSelector | None = None
+        # Windows only: frames handed over by the stdout reader thread
         self._stdout_thread: threading.Thread | None = None
-        self._stdout_queue: queue.Queue[str | None] = queue.Queue()
+        self._frames: deque[bytes | None] = deque()
+        self._frame_ready = threading.Event()
+        # Bytes read from stdout that belong to frames not yet returned
+        self._rbuf = bytearray()
+        # Reused for every request when the MessagePack codec is active
+        self._packer: "msgpack.Packer | None" = None
+        self._decode = _json_decode
+        self._state_version = 0
         self._started = False
 
     def start(self, timeout: float | None = None) -> None:
         """Start the LuaJIT subprocess and wait for the ready signal."""
         if self._started:
             return
+        with self._start_lock:
+            if not self._started:
+                self._launch(timeout)
 
+    def _launch(self, timeout: float | None) -> None:
+        """Start the subprocess and negotiate the codec. Caller holds _start_lock."""
         timeout = timeout or BRIDGE_STARTUP_TIMEOUT
-        src_dir = self._pob_path / "src"
-        bridge_script = self._pob_path / "api" / "lua" / "bridge.lua"
+        src_dir = self._src_dir
+        bridge_script = self._bridge_script
 
-        if not src_dir.is_dir():
-            raise LuaBridgeError(f"PoB src directory not found: {src_dir}")
-        if not bridge_script.is_file():
-            raise LuaBridgeError(f"Bridge script not found: {bridge_script}")
+        # One open() instead of separate stat calls; a missing src dir is
+        # reported by Popen when it can't switch into it
+        try:
+            open(bridge_script, "rb").close()
+        except OSError as e:
+            raise LuaBridgeError(f"Bridge script not found: {bridge_script}") from e
 
         logger.info("Starting LuaJIT subprocess: %s %s (cwd: %s)", self._luajit_path, bridge_script, src_dir)
 
@@ -73,132 +209,434 @@ class LuaBridge:
         if IS_WINDOWS:
             env["LUA_CPATH"] = "../runtime/?.dll;;"
 
-        self._process = subprocess.Popen(
-            [self._luajit_path, str(bridge_script)],
-            cwd=str(src_dir),
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env,
-            text=True,
-            bufsize=1,  # Line-buffered
-        )
+        # Ask for the framed protocol, and for MessagePack if we can decode it
+        # and it hasn't been turned off. The bridge reports the codec it
+        # actually picked in its ready message.
+        env["POB_BRIDGE_PROTOCOL"] = "framed"
+        use_msgpack = msgpack is not None and BRIDGE_CODEC == "msgpack"
+        env["POB_BRIDGE_CODEC"] = "msgpack" if use_msgpack else "json"
 
-        # Start stdout reader thread (cross-platform: avoids select() which
-        # doesn't work on pipes on Windows)
-        self._stdout_queue = queue.Queue()
-        self._stdout_thread = threading.Thread(
-            target=self._read_stdout,
-            daemon=True,
-            name="lua-bridge-stdout",
-        )
-        self._stdout_thread.start()
+        # Lua's stderr is only ever logged at INFO; when that is filtered out,
+        # discard it instead of reading and dropping every line in a thread
+        log_stderr = logger.isEnabledFor(logging.INFO)
+
+        try:
+            self._process = subprocess.Popen(
+                [self._luajit_path, str(bridge_script)],
+                cwd=str(src_dir),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if log_stderr else subprocess.DEVNULL,
+                env=env,
+                bufsize=0,  # Raw binary pipes; framing is handled here
+            )
+        except OSError as e:
+            if not src_dir.is_dir():
+                raise LuaBridgeError(f"PoB src directory not found: {src_dir}") from e
+            raise
+        # Requests are buffered and flushed once, right before we wait for
+        # the reply, so each command costs a single write syscall.
+        self._stdin = io.BufferedWriter(self._process.stdin, buffer_size=65536)
+        self._rbuf = bytearray()
+
+        # On POSIX, replies are read directly from the pipe by the calling
+        # thread. select() doesn't work on pipes on Windows, so there a
+        # reader thread hands frames over instead.
+        if not IS_WINDOWS:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._process.stdout, selectors.EVENT_READ)
+        else:
+            self._frames = deque()
+            self._frame_ready = threading.Event()
+            self._stdout_thread = threading.Thread(
+                target=self._read_stdout,
+                daemon=True,
+                name="lua-bridge-stdout",
+            )
+            self._stdout_thread.start()
 
         # Start stderr reader thread
-        self._stderr_thread = threading.Thread(
-            target=self._read_stderr,
-            daemon=True,
-            name="lua-bridge-stderr",
-        )
-        self._stderr_thread.start()
+        if log_stderr:
+            self._stderr_thread = threading.Thread(
+                target=self._read_stderr,
+                daemon=True,
+                name="lua-bridge-stderr",
+            )
+            self._stderr_thread.start()
 
         # Wait for ready signal
         logger.info("Waiting for bridge ready signal (timeout: %.1fs)...", timeout)
-        ready_line = self._read_line(timeout=timeout)
-        if ready_line is None:
+        ready_frame = self._read_frame(timeout=timeout)
+        if ready_frame is None:
             self._kill()
             raise LuaBridgeError("Bridge subprocess did not produce any output")
 
+        # The ready message is always JSON so the codec can be negotiated
         try:
-            ready_msg = json.loads(ready_line)
-        except json.JSONDecodeError as e:
+            ready_msg = _json_decode(ready_frame)
+        except ValueError as e:
             self._kill()
-            raise LuaBridgeError(f"Bridge ready message was not valid JSON: {ready_line!r}") from e
+            raise LuaBridgeError(f"Bridge ready message was not valid JSON: {ready_frame!r}") from e
 
-        if not ready_msg.get("ready"):
+        if not isinstance(ready_msg, dict) or not ready_msg.get("ready"):
             self._kill()
             raise LuaBridgeError(f"Unexpected ready message: {ready_msg}")
 
+        if ready_msg.get("codec") == "msgpack" and msgpack is not None:
+            self._packer = msgpack.Packer(use_bin_type=True, autoreset=False, default=json_default)
+            self._decode = _msgpack_decode
+        else:
+            self._packer = None
+            self._decode = _json_decode
+
+        self._state_version += 1  # fresh process, fresh state
         self._started = True
-        logger.info("Bridge is ready")
+        logger.info("Bridge is ready (codec: %s)", ready_msg.get("codec", "json"))
 
     def send_command(
         self,
         command: str,
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """Send a command to the Lua bridge and return the result.
 
+        Command parameters may be passed as a dict, as keyword arguments, or
+        both (keywords win), e.g. ``send_command("alloc_node", node_id=42)``.
+        ``timeout`` is always the call timeout; a command parameter with that
+        name has to go in the dict.
+
         Raises LuaBridgeError on error responses, LuaBridgeTimeout on timeout.
         """
+        return self._send(command, _merge_params(params, kwargs), timeout)
+
+    def send_void(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Send a command for its effect only; the bridge replies with just its status.
+
+        Parameters are passed as for send_command().
+        """
+        self._send(command, _merge_params(params, kwargs), timeout, {"quiet": True})
+
+    def send_field(
+        self,
+        command: str,
+        field: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a command and return one field of its result; the bridge sends only that field.
+
+        Parameters are passed as for send_command().
+        """
+        return self._send(command, _merge_params(params, kwargs), timeout, {"field": field}).get(field)
+
+    def _send(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         if not self._started:
             self.start()
 
         timeout = timeout or BRIDGE_COMMAND_TIMEOUT
 
         with self._lock:
-            return self._send_command_locked(command, params, timeout)
+            return self._send_command_locked(command, params, timeout, options)
+
+    def send_many(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        stop_on_error: bool = False,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Send several commands in a single round-trip via call_many.
+
+        Returns one {"ok": bool, "result"|"error": ...} entry per command that
+        ran. With stop_on_error, the list ends at the first failed command.
+        """
+        batch = [
+            {"command": command, "params": params} if params else {"command": command}
+            for command, params in commands
+        ]
+        result = self.send_command(
+            "call_many",
+            {"commands": batch, "stop_on_error": stop_on_error},
+            timeout,
+        )
+        return result.get("results") or []
+
+    @contextlib.contextmanager
+    def xml_handoff(self, xml: str) -> Iterator[dict[str, str]]:
+        """Yield load_build_xml params carrying the given build XML.
+
+        With the JSON codec, XML larger than XML_HANDOFF_THRESHOLD bytes is
+        written to a temp file that the bridge reads directly, instead of
+        being escaped into the request and unescaped again in Lua. The file
+        is removed once the block exits. If it can't be written, the XML is
+        sent inline instead.
+        """
+        if self._packer is not None:
+            yield {"xml": xml}
+            return
+        data = xml.encode("utf-8")
+        if len(data) <= XML_HANDOFF_THRESHOLD:
+            yield {"xml": xml}
+            return
+        with _temp_xml_path(self._handoff_dir) as path:
+            if path is not None:
+                try:
+                    with open(path, "wb") as f:
+                        f.write(data)
+                except OSError as e:
+                    logger.warning("Cannot write XML hand-off file %s (%s); sending XML inline", path, e)
+                    path = None
+            yield {"xml_path": path} if path is not None else {"xml": xml}
+
+    def export_build_xml(self, timeout: float | None = None) -> str:
+        """Return the current build as PoB export XML.
+
+        With the JSON codec, the bridge writes the XML to a temp file rather
+        than escaping it into the response, unless no temp file can be made.
+        """
+        if not self._started:
+            self.start()
+        if self._packer is not None:
+            return self.send_field("get_build_xml", "xml", timeout=timeout) or ""
+        with _temp_xml_path(self._handoff_dir) as path:
+            if path is None:
+                return self.send_field("get_build_xml", "xml", timeout=timeout) or ""
+            self.send_command("get_build_xml", {"spill_path": path}, timeout)
+            with open(path, encoding="utf-8", newline="") as f:
+                return f.read()
+
+    def stream_command(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Send a streamed command and yield each chunk as it arrives.
+
+        Parameters are passed as for send_command(). The lock is held until
+        the stream has been read to the end, so the generator should be
+        consumed promptly; closing it early drains the remaining chunks.
+        Raises LuaBridgeError if the command fails.
+        """
+        params = _merge_params(params, kwargs)
+        if not self._started:
+            self.start()
+
+        timeout = timeout or BRIDGE_COMMAND_TIMEOUT
+
+        with self._lock:
+            self._write_request_locked(command, params)
+            done = False
+            try:
+                while True:
+                    # Any response that isn't a chunk, error or not, ends the
+                    # stream; so does a timeout, after which there is
+                    # nothing reliable left to drain
+                    done = True
+                    response = self._read_response_locked(command, timeout)
+                    if "chunk" not in response:
+                        return
+                    done = False
+                    yield response["chunk"]
+            finally:
+                while not done:
+                    try:
+                        done = "chunk" not in self._read_response_locked(command, timeout)
+                    except LuaBridgeError:
+                        done = True
 
     def _send_command_locked(
         self,
         command: str,
         params: dict[str, Any] | None,
         timeout: float,
+        options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Send a command while holding the lock."""
+        self._write_request_locked(command, params, options)
+        return self._read_response_locked(command, timeout).get("result", {})
+
+    def _write_request_locked(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        """Write a request frame and flush it to the bridge.
+
+        ``options`` are top-level request fields that shape the response
+        (``quiet``, ``field``) rather than parameters of the command.
+        """
         if self._process is None or self._process.poll() is not None:
             raise LuaBridgeError("Bridge subprocess is not running")
 
-        request = {"command": command}
-        if params:
-            request["params"] = params
+        logger.debug("Sending: %s", command)
 
-        request_json = json.dumps(request, separators=(",", ":"))
-        logger.debug("Sending: %s", request_json)
+        # Bumped before the command runs, so a result cached against the old
+        # version is never mistaken for one taken after the change
+        if not _is_read_only(command, params):
+            self._state_version += 1
 
         try:
-            self._process.stdin.write(request_json + "\n")
-            self._process.stdin.flush()
+            with self._encode_request(command, params, options) as payload:
+                self._write_frame(payload)
+            self._stdin.flush()
         except (BrokenPipeError, OSError) as e:
             raise LuaBridgeError(f"Failed to write to bridge: {e}") from e
 
-        response_line = self._read_line(timeout=timeout)
-        if response_line is None:
+    def _read_response_locked(self, command: str, timeout: float) -> dict[str, Any]:
+        """Read and decode one response frame, raising on error responses."""
+        response_frame = self._read_frame(timeout=timeout)
+        if response_frame is None:
             raise LuaBridgeTimeout(f"Command '{command}' timed out after {timeout}s")
 
         try:
-            response = json.loads(response_line)
-        except json.JSONDecodeError as e:
-            raise LuaBridgeError(f"Invalid JSON response: {response_line!r}") from e
+            response = self._decode(response_frame)
+        except ValueError as e:
+            raise LuaBridgeError(f"Invalid response frame: {response_frame[:200]!r}") from e
 
-        if not response.get("ok"):
-            raise LuaBridgeError(response.get("error", "Unknown error from bridge"))
+        if not isinstance(response, dict) or not response.get("ok"):
+            error = response.get("error") if isinstance(response, dict) else None
+            raise LuaBridgeError(error or "Unknown error from bridge")
 
-        return response.get("result", {})
+        return response
 
-    def _read_stdout(self) -> None:
-        """Read lines from stdout in a background thread, pushing to queue."""
+    def _encode_request(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        options: dict[str, Any] | None = None,
+    ) -> memoryview:
+        """Encode a request, reusing the packer buffer under MessagePack.
+
+        The returned view must be released before the next request is encoded.
+        """
+        packer = self._packer
+        if packer is None:
+            request = {"command": command}
+            if params:
+                request["params"] = params
+            if options:
+                request.update(options)
+            return memoryview(_json_encode(request))
+
+        packer.reset()
+        packer.pack_map_header(1 + bool(params) + len(options or ()))
+        packer.pack("command")
+        packer.pack(command)
+        if params:
+            packer.pack("params")
+            packer.pack(params)
+        if options:
+            for key, value in options.items():
+                packer.pack(key)
+                packer.pack(value)
+        return packer.getbuffer()
+
+    def _write_frame(self, payload: bytes | memoryview) -> None:
+        """Buffer one length-prefixed frame for the subprocess stdin.
+
+        Nothing reaches the pipe until the caller flushes ``self._stdin``.
+        """
+        self._stdin.write(_FRAME_HEADER.pack(len(payload)))
+        self._stdin.write(payload)
+
+    def _read_frame_blocking(self) -> bytearray | None:
+        """Block until a whole frame has been read from stdout, or None on EOF.
+
+        stdout is read in large chunks, so a small reply (or a run of
+        streamed chunks) costs one read instead of one for the header and
+        one for the body; leftover bytes stay in ``self._rbuf`` for the next
+        frame. A frame larger than what has arrived is read straight into a
+        buffer of its own size rather than through ``self._rbuf``.
+        """
         if self._process is None or self._process.stdout is None:
-            return
+            return None
+        stdout = self._process.stdout
+        buf = self._rbuf
+        header_size = _FRAME_HEADER.size
         try:
-            for line in self._process.stdout:
-                stripped = line.rstrip("\n\r")
-                if stripped:
-                    self._stdout_queue.put(stripped)
+            while len(buf) < header_size:
+                chunk = stdout.read(_READ_CHUNK)
+                if not chunk:
+                    return None
+                buf += chunk
+            (size,) = _FRAME_HEADER.unpack_from(buf)
+            end = header_size + size
+            if len(buf) >= end:
+                frame = buf[header_size:end]
+                del buf[:end]
+                return frame
+
+            frame = bytearray(size)
+            pos = len(buf) - header_size
+            frame[:pos] = memoryview(buf)[header_size:]
+            buf.clear()
+            view = memoryview(frame)
+            while pos < size:
+                n = stdout.readinto(view[pos:])
+                if not n:
+                    return None
+                pos += n
+            return frame
         except (OSError, ValueError):
-            pass
-        finally:
-            # Signal EOF
-            self._stdout_queue.put(None)
+            return None
 
-    def _read_line(self, timeout: float) -> str | None:
-        """Read a single line from the stdout queue with timeout."""
-        try:
-            line = self._stdout_queue.get(timeout=timeout)
-            return line  # None means EOF
-        except queue.Empty:
+    def _read_frame(self, timeout: float) -> bytes | None:
+        """Read a single frame payload with timeout. None means timeout or EOF."""
+        if IS_WINDOWS:
+            return self._take_frame(timeout)
+        if self._selector is None:
             return None
+        # Only the wait for the reply is bounded; once the bridge has started
+        # writing a frame we read it to the end so the stream stays aligned.
+        # Bytes already buffered mean that has happened (or a frame is ready).
+        if not self._rbuf and not self._selector.select(timeout):
+            return None
+        return self._read_frame_blocking()
+
+    def _read_stdout(self) -> None:
+        """Windows only: read frames in a background thread and hand them over."""
+        try:
+            while True:
+                frame = self._read_frame_blocking()
+                if frame is None:
+                    break
+                self._frames.append(frame)
+                self._frame_ready.set()
+        finally:
+            # Signal EOF
+            self._frames.append(None)
+            self._frame_ready.set()
+
+    def _take_frame(self, timeout: float) -> bytes | None:
+        """Windows only: wait for the reader thread to hand over a frame."""
+        deadline = time.monotonic() + timeout
+        while not self._frames:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._frame_ready.wait(remaining):
+                return None
+            self._frame_ready.clear()
+        frame = self._frames.popleft()
+        if frame is None:
+            # Leave the EOF marker in place for any later reads
+            self._frames.appendleft(None)
+        return frame
 
     def _read_stderr(self) -> None:
         """Read stderr from the subprocess and log it."""
@@ -206,7 +644,7 @@ class LuaBridge:
             return
         try:
             for line in self._process.stderr:
-                line = line.rstrip()
+                line = line.decode("utf-8", errors="replace").rstrip()
                 if line:
                     logger.info("[lua] %s", line)
         except (OSError, ValueError):
@@ -221,6 +659,8 @@ class LuaBridge:
             except Exception:
                 pass
             self._process = None
+            self._stdin = None
+        self._close_selector()
         self._started = False
 
     def shutdown(self) -> None:
@@ -244,8 +684,26 @@ class LuaBridge:
             self._kill()
         finally:
             self._process = None
+            self._stdin = None
+            self._close_selector()
             self._started = False
 
+    def _close_selector(self) -> None:
+        """Release the POSIX stdout selector, if any."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    @property
+    def state_version(self) -> int:
+        """Counter that changes whenever a command may have changed build state."""
+        return self._state_version
+
+    @property
+    def is_busy(self) -> bool:
+        """Check if a command is currently in flight on this bridge."""
+        return self._lock.locked()
+
     @property
     def is_running(self) -> bool:
         """Check if the bridge subprocess is alive."""
@@ -5,16 +5,23 @@ the PoB calculation engine via a persistent LuaJIT subprocess.
 """
 
 import argparse
+import asyncio
 import atexit
-import json
+import functools
+import inspect
 import logging
 import sys
+import threading
+import weakref
+from typing import Any
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from .bridge_pool import LuaBridgePool
-from .config import BRIDGE_POOL_MAX_BUILDS, DEFAULT_HOST, DEFAULT_PORT
-from .lua_bridge import LuaBridgeError
+from .cache import LRUCache
+from .config import BRIDGE_POOL_MAX_BUILDS, DEFAULT_HOST, DEFAULT_PORT, STATIC_CACHE_SIZE
+from .lua_bridge import LuaBridge, LuaBridgeError, json_default
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,13 @@ mcp = FastMCP(
 
 # Global bridge pool, initialized on first use
 _pool: LuaBridgePool | None = None
+_pool_size = BRIDGE_POOL_MAX_BUILDS
+
+# Results of static-data commands, keyed by (command, encoded params)
+_static_cache = LRUCache(STATIC_CACHE_SIZE)
+
+# Per bridge: get_stats_list key tuple -> (state_version, formatted text)
+_stats_list_memo: "weakref.WeakKeyDictionary[LuaBridge, LRUCache]" = weakref.WeakKeyDictionary()
 
 class ChatGPTAuthMiddleware:
     def __init__(self, inner_app, token: str, exempt_paths: frozenset[str] = frozenset()):
@@ -59,7 +73,7 @@ def get_pool() -> LuaBridgePool:
     """Get or create the global LuaBridgePool instance."""
     global _pool
     if _pool is None:
-        _pool = LuaBridgePool(max_builds=BRIDGE_POOL_MAX_BUILDS)
+        _pool = LuaBridgePool(max_builds=_pool_size)
         atexit.register(_pool.shutdown_all)
     return _pool
 
@@ -69,21 +83,114 @@ def call(command: str, params: dict | None = None) -> dict:
     return get_pool().call(command, params)
 
 
+def call_void(command: str, params: dict | None = None) -> None:
+    """Call a bridge command on the active build when only success matters."""
+    get_pool().call_void(command, params)
+
+
 def call_any(command: str, params: dict | None = None) -> dict:
     """Call a bridge command that doesn't require a loaded build."""
     return get_pool().call_any(command, params)
 
 
+def call_static(command: str, params: dict | None = None) -> dict:
+    """Call a build-independent command over static game data, with caching.
+
+    Only for commands whose result depends solely on their params and the
+    PoB data files (base items, uniques, modifiers), never on build state.
+    """
+    key = (command, orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b"")
+    result = _static_cache.get(key)
+    if result is None:
+        result = call_any(command, params)
+        _static_cache.put(key, result)
+    return result
+
+
+def clear_static_cache() -> None:
+    """Forget cached static-data results (e.g. after the PoB data changes)."""
+    _static_cache.clear()
+
+
+def stream(command: str, params: dict | None = None):
+    """Stream a bridge command on the active build, yielding result chunks."""
+    return get_pool().stream(command, params)
+
+
 def format_result(result: dict) -> str:
     """Format a result dict as readable JSON."""
-    return json.dumps(result, indent=2, default=str)
+    # Non-string keys show up when a Lua table is keyed by number
+    return orjson.dumps(
+        result,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=json_default,
+    ).decode()
+
+
+def tool(fn):
+    """Register a synchronous tool that runs in a worker thread.
+
+    FastMCP calls sync tools directly on the event loop, and bridge calls
+    block on the LuaJIT pipe, so one slow calculation would stall every
+    other client. The wrapper keeps fn's signature and docstring.
+    """
+    @functools.wraps(fn)
+    async def run(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return mcp.tool()(run)
+
+
+def bridge_tool(
+    command: str,
+    *,
+    key: str | None = None,
+    empty: str | None = None,
+    missing: Any = None,
+    any_build: bool = False,
+    static: bool = False,
+):
+    """Register an MCP tool that forwards to a single bridge command.
+
+    The decorated function only maps its arguments to the command params
+    (returning None when there are none); the bridge call and formatting
+    are shared. Its signature and docstring still define the MCP tool.
+
+    Args:
+        command:   Lua bridge command name.
+        key:       Return only this field of the result.
+        empty:     Message returned when that field is empty. Formatted with
+                   the command params, e.g. "No nodes found matching '{query}'."
+        missing:   Value used when the result lacks that field (default []).
+        any_build: Route via call_any (the command doesn't need a loaded build).
+        static:    Route via call_static (build-independent and cacheable).
+    """
+    def decorator(build_params):
+        send = call_static if static else call_any if any_build else call
+
+        @functools.wraps(build_params)
+        def forward(*args, **kwargs) -> str:
+            params = build_params(*args, **kwargs)
+            result = send(command, params or None)
+            if key is not None:
+                result = result.get(key, [] if missing is None else missing)
+                if not result and empty is not None:
+                    return empty.format(**(params or {}))
+            return format_result(result)
+
+        # FastMCP reads the tool schema from the signature: keep the
+        # parameters but advertise the string the wrapper returns.
+        forward.__signature__ = inspect.signature(build_params).replace(return_annotation=str)
+        return tool(forward)
+
+    return decorator
 
 
 # ============================================================================
 # Build tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 def new_build(name: str = "New Build") -> str:
     """Create a new empty build and make it the active build in the pool.
 
@@ -94,7 +201,7 @@ def new_build(name: str = "New Build") -> str:
     return f"New build '{name}' created and set as active."
 
 
-@mcp.tool()
+@tool
 def load_build_xml(xml: str, name: str = "Imported Build") -> str:
     """Load a build from its XML representation and make it the active build in the pool.
 
@@ -102,30 +209,26 @@ def load_build_xml(xml: str, name: str = "Imported Build") -> str:
         xml: The full build XML content (as exported from Path of Building)
         name: A name for this build in the pool
     """
-    get_pool().load_build(name, xml=xml)
-    info = call("get_build_info")
+    info = get_pool().load_build(name, xml=xml)
     return f"Build loaded: {info.get('buildName', name)}\n" + format_result(info)
 
 
-@mcp.tool()
-def get_build_info() -> str:
+@bridge_tool("get_build_info")
+def get_build_info() -> None:
     """Get current build information including class, level, and ascendancy."""
-    result = call("get_build_info")
-    return format_result(result)
 
 
-@mcp.tool()
+@tool
 def export_build_xml() -> str:
     """Export the current build as XML that can be shared or imported into Path of Building."""
-    result = call("get_build_xml")
-    return result.get("xml", "")
+    return get_pool().export_build_xml()
 
 
 # ============================================================================
 # Tree tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 def alloc_node(node_id: int) -> str:
     """Allocate a passive tree node by its ID. This also allocates any nodes along the path to it.
 
@@ -138,7 +241,7 @@ def alloc_node(node_id: int) -> str:
     return f"Node {node_id} allocated successfully."
 
 
-@mcp.tool()
+@tool
 def dealloc_node(node_id: int) -> str:
     """Deallocate a passive tree node. Dependent nodes are also deallocated.
 
@@ -151,44 +254,53 @@ def dealloc_node(node_id: int) -> str:
     return f"Node {node_id} deallocated successfully."
 
 
-@mcp.tool()
-def get_allocated_nodes() -> str:
+@tool
+def alloc_nodes(node_ids: list[int]) -> str:
+    """Allocate several passive tree nodes in one call, in the given order.
+
+    Args:
+        node_ids: Numeric IDs of the passive tree nodes to allocate
+    """
+    results = get_pool().call_many([("alloc_node", {"node_id": n}) for n in node_ids])
+    lines = []
+    for node_id, entry in zip(node_ids, results):
+        if not entry.get("ok"):
+            lines.append(f"Node {node_id}: error: {entry.get('error')}")
+        elif entry.get("result", {}).get("already_allocated"):
+            lines.append(f"Node {node_id} was already allocated.")
+        else:
+            lines.append(f"Node {node_id} allocated successfully.")
+    return "\n".join(lines) if lines else "No nodes given."
+
+
+@bridge_tool("list_alloc_nodes", key="nodes", empty="No nodes are currently allocated.")
+def get_allocated_nodes() -> None:
     """List all currently allocated passive tree nodes."""
-    result = call("list_alloc_nodes")
-    nodes = result.get("nodes", [])
-    if not nodes:
-        return "No nodes are currently allocated."
-    return format_result(nodes)
 
 
-@mcp.tool()
-def search_nodes(query: str, max_results: int = 30) -> str:
+@bridge_tool("search_nodes", key="nodes", empty="No nodes found matching '{query}'.")
+def search_nodes(query: str, max_results: int = 30) -> dict:
     """Search for passive tree nodes by name.
 
     Args:
         query: Text to search for in node names (case-insensitive)
         max_results: Maximum number of results to return (default 30)
     """
-    result = call("search_nodes", {"query": query, "max_results": max_results})
-    nodes = result.get("nodes", [])
-    if not nodes:
-        return f"No nodes found matching '{query}'."
-    return format_result(nodes)
+    return {"query": query, "max_results": max_results}
 
 
-@mcp.tool()
-def get_node_info(node_id: int) -> str:
+@bridge_tool("get_node_info")
+def get_node_info(node_id: int) -> dict:
     """Get detailed information about a specific passive tree node.
 
     Args:
         node_id: The numeric ID of the passive tree node
     """
-    result = call("get_node_info", {"node_id": node_id})
-    return format_result(result)
+    return {"node_id": node_id}
 
 
-@mcp.tool()
-def get_node_impact(node_id: int, stats: list[str] | None = None) -> str:
+@bridge_tool("get_node_impact")
+def get_node_impact(node_id: int, stats: list[str] | None = None) -> dict:
     """Show the stat impact of allocating or deallocating a single passive node.
 
     Toggles the node, recalcs, snapshots the delta, then restores — all in one
@@ -202,12 +314,11 @@ def get_node_impact(node_id: int, stats: list[str] | None = None) -> str:
     params: dict = {"node_id": node_id}
     if stats:
         params["stats"] = stats
-    result = call("get_node_impact", params)
-    return format_result(result)
+    return params
 
 
-@mcp.tool()
-def get_nodes_impact(node_ids: list[int], stats: list[str] | None = None) -> str:
+@bridge_tool("get_nodes_impact", key="nodes", empty="No results.")
+def get_nodes_impact(node_ids: list[int], stats: list[str] | None = None) -> dict:
     """Show the stat impact of toggling multiple passive nodes, in one call.
 
     Evaluates each node independently (all others at their current state) using
@@ -221,29 +332,20 @@ def get_nodes_impact(node_ids: list[int], stats: list[str] | None = None) -> str
     params: dict = {"node_ids": node_ids}
     if stats:
         params["stats"] = stats
-    result = call("get_nodes_impact", params)
-    nodes = result.get("nodes", [])
-    if not nodes:
-        return "No results."
-    return format_result(nodes)
+    return params
 
 
 # ============================================================================
 # Item tools
 # ============================================================================
 
-@mcp.tool()
-def list_items() -> str:
+@bridge_tool("list_items", key="items", empty="No items in the build.")
+def list_items() -> None:
     """List all items currently in the build."""
-    result = call("list_items")
-    items = result.get("items", [])
-    if not items:
-        return "No items in the build."
-    return format_result(items)
 
 
-@mcp.tool()
-def get_item_details(item_id: int) -> str:
+@bridge_tool("get_item_details")
+def get_item_details(item_id: int) -> dict:
     """Get detailed information about a specific item in the build.
 
     Args:
@@ -255,12 +357,11 @@ def get_item_details(item_id: int) -> str:
     - All mods: implicits, explicits, enchants, runes
     - Equipment slot if equipped
     """
-    result = call("get_item_details", {"item_id": item_id})
-    return format_result(result)
+    return {"item_id": item_id}
 
 
-@mcp.tool()
-def dump_item_fields(item_id: int) -> str:
+@bridge_tool("dump_item_fields", key="fields", missing={})
+def dump_item_fields(item_id: int) -> dict:
     """Debug: dump all scalar fields on a raw Lua item object.
 
     Use this to discover the actual field names available on an item —
@@ -269,12 +370,11 @@ def dump_item_fields(item_id: int) -> str:
     Args:
         item_id: The ID of the item (from list_items)
     """
-    result = call("dump_item_fields", {"item_id": item_id})
-    return format_result(result.get("fields", {}))
+    return {"item_id": item_id}
 
 
-@mcp.tool()
-def get_all_equipped_items() -> str:
+@bridge_tool("get_all_equipped_items", key="items", empty="No equipped items found.")
+def get_all_equipped_items() -> None:
     """Return full details for every equipped item in a single call.
 
     Equivalent to calling get_item_details on each result from list_items
@@ -282,15 +382,10 @@ def get_all_equipped_items() -> str:
     base stats, mods (implicits, explicits, enchants), socketed rune/idol
     names, rune effects, socket counts, and the slot it occupies.
     """
-    result = call("get_all_equipped_items")
-    items = result.get("items", [])
-    if not items:
-        return "No equipped items found."
-    return format_result(items)
 
 
-@mcp.tool()
-def get_item_impact(item_id: int, stats: list[str] | None = None) -> str:
+@bridge_tool("get_item_impact")
+def get_item_impact(item_id: int, stats: list[str] | None = None) -> dict:
     """Show the stat impact of an equipped item by temporarily unequipping it and diffing.
 
     Unequips the item, captures the stat delta, then re-equips it — all in one
@@ -305,12 +400,11 @@ def get_item_impact(item_id: int, stats: list[str] | None = None) -> str:
     params: dict = {"item_id": item_id}
     if stats:
         params["stats"] = stats
-    result = call("get_item_impact", params)
-    return format_result(result)
+    return params
 
 
-@mcp.tool()
-def get_all_equipped_items_impact(stats: list[str] | None = None) -> str:
+@bridge_tool("get_all_equipped_items_impact", key="items", empty="No equipped items found.")
+def get_all_equipped_items_impact(stats: list[str] | None = None) -> dict | None:
     """Show the stat impact of every equipped item, evaluated one at a time.
 
     For each equipped item, temporarily unequips it (with all others still on),
@@ -321,18 +415,11 @@ def get_all_equipped_items_impact(stats: list[str] | None = None) -> str:
         stats: Optional list of specific stat keys to evaluate. Defaults to the
                standard curated stat set (DPS, life, resists, EHP, etc.)
     """
-    params: dict = {}
-    if stats:
-        params["stats"] = stats
-    result = call("get_all_equipped_items_impact", params if params else None)
-    items = result.get("items", [])
-    if not items:
-        return "No equipped items found."
-    return format_result(items)
+    return {"stats": stats} if stats else None
 
 
-@mcp.tool()
-def search_base_items(query: str, item_type: str | None = None, max_results: int = 50) -> str:
+@bridge_tool("search_base_items", key="items", empty="No base items found matching '{query}'.", static=True)
+def search_base_items(query: str, item_type: str | None = None, max_results: int = 50) -> dict:
     """Search for item base types (e.g., "Greathelm", "Staff").
     
     Args:
@@ -340,39 +427,29 @@ def search_base_items(query: str, item_type: str | None = None, max_results: int
         item_type: Optional filter by item type/category (e.g., "Helmet", "Staff")
         max_results: Maximum number of results to return (default 50)
     """
-    params = {"query": query, "max_results": max_results}
+    params: dict = {"query": query, "max_results": max_results}
     if item_type:
         params["type"] = item_type
-    result = call_any("search_base_items", params)
-    items = result.get("items", [])
-    if not items:
-        return f"No base items found matching '{query}'."
-    return format_result(items)
+    return params
 
 
-@mcp.tool()
-def get_base_item_types() -> str:
+@bridge_tool("get_base_item_types", key="types", empty="No item types found.", static=True)
+def get_base_item_types() -> None:
     """List all available item base type categories (e.g., Helmet, Staff, Amulet)."""
-    result = call_any("get_base_item_types")
-    types = result.get("types", [])
-    if not types:
-        return "No item types found."
-    return format_result(types)
 
 
-@mcp.tool()
-def get_base_item_details(name: str) -> str:
+@bridge_tool("get_base_item_details", static=True)
+def get_base_item_details(name: str) -> dict:
     """Get detailed information about a specific base item.
     
     Args:
         name: The exact name of the base item (e.g., "Rusted Greathelm")
     """
-    result = call_any("get_base_item_details", {"name": name})
-    return format_result(result)
+    return {"name": name}
 
 
-@mcp.tool()
-def search_unique_items(query: str, item_type: str | None = None, max_results: int = 50) -> str:
+@bridge_tool("search_unique_items", key="uniques", empty="No unique items found matching '{query}'.", static=True)
+def search_unique_items(query: str, item_type: str | None = None, max_results: int = 50) -> dict:
     """Search for unique items by name or base type.
     
     Args:
@@ -380,28 +457,23 @@ def search_unique_items(query: str, item_type: str | None = None, max_results: i
         item_type: Optional filter by item type (e.g., "helmet", "sword")
         max_results: Maximum number of results to return (default 50)
     """
-    params = {"query": query, "max_results": max_results}
+    params: dict = {"query": query, "max_results": max_results}
     if item_type:
         params["type"] = item_type
-    result = call_any("search_unique_items", params)
-    uniques = result.get("uniques", [])
-    if not uniques:
-        return f"No unique items found matching '{query}'."
-    return format_result(uniques)
+    return params
 
 
-@mcp.tool()
-def get_unique_item_details(name: str) -> str:
+@bridge_tool("get_unique_item_details", static=True)
+def get_unique_item_details(name: str) -> dict:
     """Get detailed information about a specific unique item.
     
     Args:
         name: The exact name of the unique item (e.g., "Black Sun Crest")
     """
-    result = call_any("get_unique_item_details", {"name": name})
-    return format_result(result)
+    return {"name": name}
 
 
-@mcp.tool()
+@tool
 def save_build() -> str:
     """Save the current build back to its original XML file.
 
@@ -412,11 +484,11 @@ def save_build() -> str:
     Raises an error if the build was loaded from raw XML text rather than a
     file (use save_build_as in that case).
     """
-    call("save_build")
+    call_void("save_build")
     return "Build saved successfully."
 
 
-@mcp.tool()
+@tool
 def save_build_as(name: str, sub_path: str = "") -> str:
     """Save the current build to a new XML file under a chosen name.
 
@@ -434,7 +506,7 @@ def save_build_as(name: str, sub_path: str = "") -> str:
     return f"Build saved as '{name}' → {result.get('path', '?')}"
 
 
-@mcp.tool()
+@tool
 def add_item(item_raw: str, slot: str | None = None) -> str:
     """Add an item to the build from its text representation.
 
@@ -452,7 +524,7 @@ def add_item(item_raw: str, slot: str | None = None) -> str:
     return msg
 
 
-@mcp.tool()
+@tool
 def equip_item(item_id: int, slot: str) -> str:
     """Equip an existing item to a specific equipment slot.
 
@@ -460,32 +532,25 @@ def equip_item(item_id: int, slot: str) -> str:
         item_id: The ID of the item (from list_items)
         slot: The equipment slot name (e.g., "Helmet", "Weapon 1", "Ring 1", "Body Armour")
     """
-    call("equip_item", {"item_id": item_id, "slot": slot})
+    call_void("equip_item", {"item_id": item_id, "slot": slot})
     return f"Item {item_id} equipped to {slot}."
 
 
-@mcp.tool()
-def list_slots() -> str:
+@bridge_tool("list_slots", key="slots")
+def list_slots() -> None:
     """List all equipment slots and what items are currently equipped in them."""
-    result = call("list_slots")
-    return format_result(result.get("slots", []))
 
 
 # ============================================================================
 # Skill tools
 # ============================================================================
 
-@mcp.tool()
-def list_skills() -> str:
+@bridge_tool("list_skills", key="skills", empty="No skills in the build.")
+def list_skills() -> None:
     """List all skill gem groups in the build."""
-    result = call("list_skills")
-    skills = result.get("skills", [])
-    if not skills:
-        return "No skills in the build."
-    return format_result(skills)
 
 
-@mcp.tool()
+@tool
 def add_skill(skill_text: str) -> str:
     """Add a skill gem group to the build.
 
@@ -504,14 +569,14 @@ def add_skill(skill_text: str) -> str:
     )
 
 
-@mcp.tool()
+@tool
 def set_main_skill(index: int) -> str:
     """Set which skill gem group is the main (active) skill for DPS calculations.
 
     Args:
         index: 1-based index of the skill group (from list_skills)
     """
-    call("set_main_skill", {"index": index})
+    call_void("set_main_skill", {"index": index})
     return f"Main skill set to group {index}."
 
 
@@ -519,8 +584,8 @@ def set_main_skill(index: int) -> str:
 # Calculation tools
 # ============================================================================
 
-@mcp.tool()
-def get_stats(keys: list[str] | None = None) -> str:
+@bridge_tool("get_output")
+def get_stats(keys: list[str] | None = None) -> dict | None:
     """Get calculated build statistics (DPS, life, resistances, etc.).
 
     Args:
@@ -529,21 +594,25 @@ def get_stats(keys: list[str] | None = None) -> str:
             FullDPS, Life, EnergyShield, Mana, FireResist, ColdResist,
             LightningResist, ChaosResist, Armour, Evasion, TotalEHP, Speed, etc.
     """
-    params = {}
-    if keys:
-        params["stats"] = keys
-    result = call("get_output", params if params else None)
-    return format_result(result)
+    return {"stats": keys} if keys else None
 
 
-@mcp.tool()
+@tool
 def get_full_stats() -> str:
     """Get the complete calculation output with all available stats. This can be very large."""
-    result = call("get_full_output")
-    return format_result(result)
-
-
-@mcp.tool()
+    # Format each chunk as it arrives and splice the JSON objects together,
+    # so the whole output is never held as one dict and encoded again.
+    bodies = []
+    for chunk in stream("get_full_output_stream"):
+        text = format_result(chunk)
+        if text != "{}":
+            bodies.append(text[2:-2])  # drop the "{\n" and "\n}" around the entries
+    if not bodies:
+        return "{}"
+    return "{\n" + ",\n".join(bodies) + "\n}"
+
+
+@tool
 def get_stat(key: str) -> str:
     """Retrieve a specific stat value from the full calculation output.
     
@@ -563,7 +632,7 @@ def get_stat(key: str) -> str:
     return f"{key}: {value}"
 
 
-@mcp.tool()
+@tool
 def get_stats_list(keys: list[str]) -> str:
     """Retrieve multiple specific stats at once from the calculation output.
     
@@ -573,28 +642,30 @@ def get_stats_list(keys: list[str]) -> str:
     Returns multiple stat values in a single call. More efficient than calling
     get_stat multiple times when you need several stats.
     """
-    result = call("get_stats_list", {"keys": keys})
-    found = result.get("found", {})
-    not_found = result.get("not_found", [])
-    
-    output = []
-    output.append(f"Retrieved {result.get('found_count', 0)}/{result.get('count', 0)} stats:\n")
-    
-    for key, data in found.items():
-        value = data.get("value")
-        if data.get("type") == "table":
-            table_data = value if isinstance(value, dict) else {}
-            output.append(f"{key} (table): {format_result(table_data)}")
-        else:
-            output.append(f"{key}: {value}")
-    
-    if not_found:
-        output.append(f"\nNot found: {', '.join(not_found)}")
-    
-    return "\n".join(output)
+    bridge = get_pool().get_bridge()
+    memo = _stats_list_memo.get(bridge)
+    if memo is None:
+        memo = _stats_list_memo.setdefault(bridge, LRUCache(32))
+
+    # A client polling the same stats gets the last answer back as long as
+    # nothing has changed the build since
+    memo_key = tuple(keys)
+    version = bridge.state_version
+    cached = memo.get(memo_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    result = bridge.send_command("get_stats_list", {"keys": keys})
+    found = {key: data.get("value") for key, data in (result.get("found") or {}).items()}
+    text = (
+        f"Retrieved {result.get('found_count', 0)}/{result.get('count', 0)} stats:\n"
+        + format_result({"found": found, "not_found": result.get("not_found") or []})
+    )
+    memo.put(memo_key, (version, text))
+    return text
 
 
-@mcp.tool()
+@tool
 def get_minion_stats(keys: list[str] | None = None) -> str:
     """Get calculated stats for the minion of the current main skill.
 
@@ -619,8 +690,8 @@ def get_minion_stats(keys: list[str] | None = None) -> str:
     return format_result(result)
 
 
-@mcp.tool()
-def search_modifiers(query: str, mod_type: str = "Item", max_results: int = 30) -> str:
+@bridge_tool("search_modifiers", key="groups", empty="No modifiers found matching '{query}' in {mod_type}.", static=True)
+def search_modifiers(query: str, mod_type: str = "Item", max_results: int = 30) -> dict:
     """Search for modifier groups by name, affix, or effect text.
     
     Args:
@@ -631,14 +702,10 @@ def search_modifiers(query: str, mod_type: str = "Item", max_results: int = 30)
     Returns modifier groups with tier count and basic info. Use get_modifier_tiers
     to see all tiers for a specific group.
     """
-    result = call("search_modifiers", {"query": query, "mod_type": mod_type, "max_results": max_results})
-    groups = result.get("groups", [])
-    if not groups:
-        return f"No modifiers found matching '{query}' in {mod_type}."
-    return format_result(groups)
+    return {"query": query, "mod_type": mod_type, "max_results": max_results}
 
 
-@mcp.tool()
+@tool
 def get_modifier_tiers(group: str, mod_type: str = "Item") -> str:
     """Get all tiers for a specific modifier group with their ranges and requirements.
     
@@ -652,7 +719,7 @@ def get_modifier_tiers(group: str, mod_type: str = "Item") -> str:
     - Required item level
     - Which item types can roll it
     """
-    result = call_any("get_modifier_tiers", {"group": group, "mod_type": mod_type})
+    result = call_static("get_modifier_tiers", {"group": group, "mod_type": mod_type})
     tiers = result.get("tiers", [])
     if not tiers:
         return f"No tiers found for group '{group}' in {mod_type}."
@@ -668,7 +735,7 @@ def get_modifier_tiers(group: str, mod_type: str = "Item") -> str:
     return "\n".join(output)
 
 
-@mcp.tool()
+@tool
 def get_modifiers_for_item_type(item_type: str, mod_type: str = "Item", 
                                 affix_type: str | None = None, max_results: int = 50) -> str:
     """Get all modifiers that can roll on a specific item type.
@@ -694,7 +761,7 @@ def get_modifiers_for_item_type(item_type: str, mod_type: str = "Item",
     if affix_type:
         params["affix_type"] = affix_type
     
-    result = call_any("get_modifiers_for_item_type", params)
+    result = call_static("get_modifiers_for_item_type", params)
     modifiers = result.get("modifiers", [])
     if not modifiers:
         filter_text = f" {affix_type.lower()}" if affix_type else ""
@@ -702,8 +769,8 @@ def get_modifiers_for_item_type(item_type: str, mod_type: str = "Item",
     return format_result(modifiers)
 
 
-@mcp.tool()
-def get_modifier_types() -> str:
+@bridge_tool("get_modifier_types", key="types", empty="No modifier types found.", static=True)
+def get_modifier_types() -> None:
     """List all available modifier type categories.
     
     Returns the different modifier databases available for querying:
@@ -719,15 +786,10 @@ def get_modifier_types() -> str:
     Use these type names with search_modifiers, get_modifier_tiers, and
     get_modifiers_for_item_type functions.
     """
-    result = call_any("get_modifier_types")
-    types = result.get("types", [])
-    if not types:
-        return "No modifier types found."
-    return format_result(types)
 
 
-@mcp.tool()
-def get_item_modifier_tags(mod_type: str = "Item") -> str:
+@bridge_tool("get_item_modifier_tags", key="tags", empty="No modifier tags found for {mod_type}.", static=True)
+def get_item_modifier_tags(mod_type: str = "Item") -> dict:
     """List all item type tags that can have modifiers.
     
     Args:
@@ -743,14 +805,10 @@ def get_item_modifier_tags(mod_type: str = "Item") -> str:
     - Accessories: ring, amulet, belt, quiver
     - Special: str_armour, dex_armour, int_armour (attribute-based armour)
     """
-    result = call_any("get_item_modifier_tags", {"mod_type": mod_type})
-    tags = result.get("tags", [])
-    if not tags:
-        return f"No modifier tags found for {mod_type}."
-    return format_result(tags)
+    return {"mod_type": mod_type}
 
 
-@mcp.tool()
+@tool
 def search_item_types(query: str, max_results: int = 50) -> str:
     """Search for item types by name or category.
     
@@ -767,7 +825,7 @@ def search_item_types(query: str, max_results: int = 50) -> str:
     - "Two Handed Sword" with tags
     etc.
     """
-    result = call_any("search_item_types", {"query": query, "max_results": max_results})
+    result = call_static("search_item_types", {"query": query, "max_results": max_results})
     types = result.get("types", [])
     if not types:
         return f"No item types found matching '{query}'."
@@ -790,7 +848,7 @@ def search_item_types(query: str, max_results: int = 50) -> str:
 # Build flag / condition tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 def check_flag(flag: str) -> str:
     """Check whether a build flag or condition is active for the current character.
 
@@ -814,8 +872,8 @@ def check_flag(flag: str) -> str:
 # Config tools
 # ============================================================================
 
-@mcp.tool()
-def list_config_options() -> str:
+@bridge_tool("list_config_options", key="options", empty="No applicable config options for this build.")
+def list_config_options() -> None:
     """List all configuration options that are applicable to the current build.
 
     Only returns options whose conditions are met (same visibility logic as the
@@ -827,14 +885,9 @@ def list_config_options() -> str:
     - label: human-readable description
     - value: current setting (None means using default)
     """
-    result = call("list_config_options")
-    options = result.get("options", [])
-    if not options:
-        return "No applicable config options for this build."
-    return format_result(options)
 
 
-@mcp.tool()
+@tool
 def set_config(key: str, value: str | int | float | bool) -> str:
     """Set a configuration option for the build (e.g., enemy type, conditions).
 
@@ -844,11 +897,11 @@ def set_config(key: str, value: str | int | float | bool) -> str:
         key: Configuration key name (e.g., "enemyIsBoss", "conditionStationary")
         value: Value to set (string, number, or boolean depending on the option)
     """
-    call("set_config", {"key": key, "value": value})
+    call_void("set_config", {"key": key, "value": value})
     return f"Config '{key}' set to {value!r}."
 
 
-@mcp.tool()
+@tool
 def set_custom_mods(mods: str) -> str:
     """Set custom modifiers on build. These are applied as additional modifiers.
 
@@ -856,7 +909,7 @@ def set_custom_mods(mods: str) -> str:
         mods: Custom modifier text, one modifier per line. Example:
             "10% increased Attack Speed\\n20% increased Physical Damage"
     """
-    call("set_custom_mods", {"mods": mods})
+    call_void("set_custom_mods", {"mods": mods})
     return "Custom mods applied."
 
 
@@ -864,7 +917,7 @@ def set_custom_mods(mods: str) -> str:
 # File management tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 def list_builds(sub_path: str = "") -> str:
     """List saved builds with their metadata.
 
@@ -898,7 +951,7 @@ def list_builds(sub_path: str = "") -> str:
     return "\n".join(output)
 
 
-@mcp.tool()
+@tool
 def load_build_file(path: str) -> str:
     """Load a build from its file path and make it the active build in the pool.
 
@@ -909,19 +962,41 @@ def load_build_file(path: str) -> str:
     """
     from pathlib import Path as _Path
     name = _Path(path).stem
-    get_pool().load_build(name, path=path)
-    info = call("get_build_info")
+    info = get_pool().load_build(name, path=path)
     build_name = info.get("buildName", "Unknown")
     class_name = info.get("className", "Unknown")
     level = info.get("level", "Unknown")
     return f"Build loaded: {build_name} (pool name: '{name}')\nClass: {class_name} (Level {level})"
 
 
+# ============================================================================
+# Batch tools
+# ============================================================================
+
+@tool
+def batch(commands: list[dict], stop_on_error: bool = False) -> str:
+    """Run several bridge commands against the active build in one round-trip.
+
+    Each entry is {"command": "<bridge command>", "params": {...}}, using the
+    raw Lua bridge command names (e.g. alloc_node, get_stat, set_config).
+    Returns one {"ok", "result" | "error"} entry per command, in order.
+
+    Args:
+        commands: The commands to run, in order
+        stop_on_error: Stop at the first failing command (default False)
+    """
+    results = get_pool().call_many(
+        [(c.get("command", ""), c.get("params")) for c in commands],
+        stop_on_error=stop_on_error,
+    )
+    return format_result({"results": results})
+
+
 # ============================================================================
 # Pool management tools
 # ============================================================================
 
-@mcp.tool()
+@tool
 def list_loaded_builds() -> str:
     """List all builds currently loaded in the pool, showing which is active.
 
@@ -939,7 +1014,7 @@ def list_loaded_builds() -> str:
     return "Loaded builds:\n" + "\n".join(lines)
 
 
-@mcp.tool()
+@tool
 def switch_active_build(name: str) -> str:
     """Switch the active build. All subsequent tool calls will target this build.
 
@@ -954,7 +1029,7 @@ def switch_active_build(name: str) -> str:
     return f"Switched to '{name}': {build_name} ({class_name}, Level {level})"
 
 
-@mcp.tool()
+@tool
 def unload_build(name: str) -> str:
     """Remove a build from the pool, freeing its LuaJIT process.
 
@@ -971,14 +1046,14 @@ def unload_build(name: str) -> str:
     return msg
 
 
-@mcp.tool()
+@tool
 def save_build() -> str:
     """Save the current build to its existing file."""
-    call("save_build")
+    call_void("save_build")
     return "Build saved successfully."
 
 
-@mcp.tool()
+@tool
 def save_build_as(name: str, sub_path: str = "") -> str:
     """Save the current build to a new file.
 
@@ -990,7 +1065,7 @@ def save_build_as(name: str, sub_path: str = "") -> str:
     return f"Build saved as: {result.get('path', 'Unknown')}"
 
 
-@mcp.tool()
+@tool
 def delete_build_file(path: str) -> str:
     """Delete a build file.
 
@@ -1001,7 +1076,7 @@ def delete_build_file(path: str) -> str:
     return f"Build file deleted: {path}"
 
 
-@mcp.tool()
+@tool
 def create_builds_folder(name: str, sub_path: str = "") -> str:
     """Create a subfolder in the builds directory.
 
@@ -1013,7 +1088,7 @@ def create_builds_folder(name: str, sub_path: str = "") -> str:
     return f"Folder created: {result.get('path', 'Unknown')}"
 
 
-@mcp.tool()
+@tool
 def rename_build_file(old_path: str, new_name: str) -> str:
     """Rename a build file.
 
@@ -1025,6 +1100,13 @@ def rename_build_file(old_path: str, new_name: str) -> str:
     return f"Build renamed to: {result.get('new_path', 'Unknown')}"
 
 
+def _warm_pool() -> None:
+    try:
+        get_pool().warm()
+    except Exception:
+        logger.exception("Failed to pre-warm the Lua bridge")
+
+
 def run_server():
     """Run the MCP + REST unified server."""
     import os
@@ -1042,6 +1124,7 @@ Examples:
   %(prog)s                                          # streamable-http on default port
   %(prog)s --host 0.0.0.0 --port 8080              # bind all interfaces
   %(prog)s --api-secret <token>                     # enable bearer-token auth
+  %(prog)s --pool-size 8                            # keep up to 8 builds loaded
   %(prog)s --transport stdio                        # local Claude Desktop
         """,
     )
@@ -1073,8 +1156,17 @@ Examples:
         default=os.environ.get("POB_API_SECRET"),
         help="Bearer token for auth (also read from POB_API_SECRET env var)",
     )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=BRIDGE_POOL_MAX_BUILDS,
+        help=f"Max builds kept loaded, one LuaJIT process each (default: {BRIDGE_POOL_MAX_BUILDS})",
+    )
     args = parser.parse_args()
 
+    global _pool_size
+    _pool_size = max(1, args.pool_size)
+
     log_level_int = getattr(logging, args.log_level)
 
     logging.basicConfig(
@@ -1094,6 +1186,10 @@ Examples:
     ):
         logging.getLogger(_mod).setLevel(log_level_int)
 
+    # Start the first bridge while the transport comes up, so the first
+    # tool call doesn't wait for PoB to load its data
+    threading.Thread(target=_warm_pool, daemon=True, name="pob-prewarm").start()
+
     if args.transport == "stdio":
         logger.info("Starting MCP server in stdio mode")
         mcp.run(transport="stdio")
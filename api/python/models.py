@@ -1,6 +1,11 @@
-"""Pydantic request/response models for the PoB REST API."""
+"""Request/response models for the PoB REST API.
 
-from typing import Any, Optional
+Leaf response records are plain slotted dataclasses; Pydantic models are
+kept for request bodies and for responses that nest them.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,18 +14,15 @@ from pydantic import BaseModel, Field
 # Build models
 # ============================================================================
 
-class LoadBuildXmlRequest(BaseModel):
-    xml: str = Field(..., description="Build XML content")
-    name: str = Field("Imported Build", description="Build name")
-
-
 class BuildInfo(BaseModel):
     className: Optional[str] = None
     ascendClassName: Optional[str] = None
-    level: Optional[int] = None
-    mainSocketGroup: Optional[int] = None
-    viewMode: Optional[str] = None
+    level: int = 1
+    mainSocketGroup: int = 1
+    viewMode: str = ""
     buildName: Optional[str] = None
+    isMinionBuild: bool = False
+    mainSkillName: Optional[str] = None
 
 
 class BuildXmlResponse(BaseModel):
@@ -33,21 +35,22 @@ class BuildXmlResponse(BaseModel):
 
 class NodeInfo(BaseModel):
     id: int
-    name: str | None = None
+    name: str = ""
     type: str | None = None
     alloc: bool = False
     ascendancyName: str | None = None
-    mods: list[str] | None = None
-    linked: list[int] | None = None
+    mods: list[str] = []
+    linked: list[int] = []
     classStartIndex: int | None = None
     isMultipleChoice: bool = False
     isMultipleChoiceOption: bool = False
     passivePointsGranted: int = 0
 
 
-class NodeSummary(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NodeSummary:
     id: int
-    name: str | None = None
+    name: str = ""
     type: str | None = None
     alloc: bool = False
     ascendancyName: str | None = None
@@ -71,7 +74,8 @@ class SearchNodesResponse(BaseModel):
 # Item models
 # ============================================================================
 
-class ItemSummary(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ItemSummary:
     id: int
     name: str
     baseName: str | None = None
@@ -79,22 +83,13 @@ class ItemSummary(BaseModel):
     rarity: str | None = None
 
 
-class SlotInfo(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SlotInfo:
     slotName: str
     itemId: int = 0
     itemName: str | None = None
 
 
-class AddItemRequest(BaseModel):
-    item_raw: str = Field(..., description="Item text in PoE copy-paste format")
-    slot: str | None = Field(None, description="Optional slot to equip the item to")
-
-
-class EquipItemRequest(BaseModel):
-    item_id: int
-    slot: str
-
-
 class UnequipSlotRequest(BaseModel):
     slot: str
 
@@ -103,8 +98,9 @@ class UnequipSlotRequest(BaseModel):
 # Skill models
 # ============================================================================
 
-class GemInfo(BaseModel):
-    nameSpec: str | None = None
+@dataclass(slots=True, frozen=True, kw_only=True)
+class GemInfo:
+    nameSpec: str = ""
     level: int | None = None
     quality: int | None = None
     enabled: bool = True
@@ -124,22 +120,6 @@ class SkillGroupInfo(BaseModel):
     gems: list[GemInfo] = []
 
 
-class AddSkillRequest(BaseModel):
-    skill_text: str = Field(
-        ...,
-        description=(
-            "Skill text in paste format. Example:\n"
-            "Label: My Skill\n"
-            "Fireball 20/0 1\n"
-            "Combustion Support 20/0 1"
-        ),
-    )
-
-
-class SetMainSkillRequest(BaseModel):
-    index: int = Field(..., ge=1)
-
-
 # ============================================================================
 # Calc / Output models
 # ============================================================================
@@ -151,24 +131,12 @@ class CalcStatsRequest(BaseModel):
     )
 
 
-# ============================================================================
-# Config models
-# ============================================================================
-
-class SetConfigRequest(BaseModel):
-    key: str
-    value: Any
-
-
-class SetCustomModsRequest(BaseModel):
-    mods: str = Field(..., description="Custom modifier text, one mod per line")
-
-
 # ============================================================================
 # File management models
 # ============================================================================
 
-class BuildFileInfo(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BuildFileInfo:
     id: str
     name: str
     fileName: str
@@ -179,7 +147,8 @@ class BuildFileInfo(BaseModel):
     modified: int
 
 
-class FolderInfo(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FolderInfo:
     name: str
     fullPath: str
 
@@ -0,0 +1,115 @@
+"""msgspec request bodies for the hot REST POST endpoints.
+
+These are decoded straight from the raw request body with msgspec, which
+validates small flat payloads far faster than building a Pydantic model per
+request. Less frequent endpoints keep their Pydantic models in models.py.
+"""
+
+import re
+from typing import Annotated, Any
+
+import msgspec
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+
+
+# ============================================================================
+# Request bodies
+# ============================================================================
+
+class LoadBuildXmlRequest(msgspec.Struct, frozen=True):
+    xml: Annotated[str, msgspec.Meta(description="Build XML content")]
+    name: Annotated[str, msgspec.Meta(description="Build name")] = "Imported Build"
+
+
+class AddItemRequest(msgspec.Struct, frozen=True):
+    item_raw: Annotated[str, msgspec.Meta(description="Item text in PoE copy-paste format")]
+    slot: Annotated[str | None, msgspec.Meta(description="Optional slot to equip the item to")] = None
+
+
+class EquipItemRequest(msgspec.Struct, frozen=True):
+    item_id: int
+    slot: str
+
+
+class AddSkillRequest(msgspec.Struct, frozen=True):
+    skill_text: Annotated[str, msgspec.Meta(description=(
+        "Skill text in paste format. Example:\n"
+        "Label: My Skill\n"
+        "Fireball 20/0 1\n"
+        "Combustion Support 20/0 1"
+    ))]
+
+
+class SetMainSkillRequest(msgspec.Struct, frozen=True):
+    index: Annotated[int, msgspec.Meta(ge=1)]
+
+
+class SetConfigRequest(msgspec.Struct, frozen=True):
+    key: str
+    value: Any
+
+
+class SetCustomModsRequest(msgspec.Struct, frozen=True):
+    mods: Annotated[str, msgspec.Meta(description="Custom modifier text, one mod per line")]
+
+
+# ============================================================================
+# FastAPI integration
+# ============================================================================
+
+# One ".key" or "[index]" step of a msgspec error path
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD = re.compile(r"Object missing required field `([^`]+)`")
+
+
+def msgspec_body(cls: type[msgspec.Struct]) -> Any:
+    """Dependency that decodes the JSON request body into ``cls``.
+
+    Invalid bodies are rejected with a 422, like FastAPI's own validation.
+    """
+    decoder = msgspec.json.Decoder(cls)
+
+    async def decode(request: Request) -> msgspec.Struct:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as e:
+            raise RequestValidationError([_validation_error(str(e))]) from e
+        except msgspec.DecodeError as e:
+            raise RequestValidationError([
+                {"type": "json_invalid", "loc": ["body"], "msg": str(e)}
+            ]) from e
+
+    return Depends(decode)
+
+
+def _validation_error(message: str) -> dict[str, Any]:
+    """Turn a msgspec validation message into a FastAPI-style error entry.
+
+    msgspec reports the location as a JSON path suffix, e.g.
+    "Expected `int` >= 1 - at `$.index`"; it becomes ``loc``.
+    """
+    msg, sep, path = message.rpartition(" - at `")
+    if not sep:
+        msg, path = message, "$`"
+    loc: list[str | int] = ["body"]
+    for key, index in _PATH_PART.findall(path[1:-1]):
+        loc.append(int(index) if index else key)
+
+    error_type = "value_error"
+    missing = _MISSING_FIELD.match(msg)
+    if missing:
+        error_type = "missing"
+        loc.append(missing.group(1))
+    return {"type": error_type, "loc": loc, "msg": msg}
+
+
+def openapi_body(cls: type[msgspec.Struct]) -> dict[str, Any]:
+    """openapi_extra documenting ``cls`` as the route's JSON request body."""
+    _, components = msgspec.json.schema_components((cls,))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[cls.__name__]}},
+        }
+    }
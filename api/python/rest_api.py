@@ -1,39 +1,46 @@
 """FastAPI REST API for Path of Building PoE2."""
 
 import logging
+import secrets
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
+from .cache import LRUCache
+from .coalesce import OutputCoalescer
 from .lua_bridge import LuaBridge, LuaBridgeError
 from .models import (
-    AddItemRequest,
-    AddSkillRequest,
-    BuildFileInfo,
     BuildInfo,
     BuildXmlResponse,
     CalcStatsRequest,
     CreateFolderRequest,
     DeleteBuildFileRequest,
-    EquipItemRequest,
-    FolderInfo,
     HealthResponse,
     ItemSummary,
     LoadBuildFileRequest,
-    LoadBuildXmlRequest,
     NodeInfo,
-    NodeSummary,
     RenameBuildFileRequest,
     SaveBuildAsRequest,
     SearchNodesResponse,
-    SetConfigRequest,
-    SetCustomModsRequest,
-    SetMainSkillRequest,
     SkillGroupInfo,
     SlotInfo,
     SuccessResponse,
 )
+from .request_structs import (
+    AddItemRequest,
+    AddSkillRequest,
+    EquipItemRequest,
+    LoadBuildXmlRequest,
+    SetConfigRequest,
+    SetCustomModsRequest,
+    SetMainSkillRequest,
+    msgspec_body,
+    openapi_body,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,12 +55,88 @@ def get_bridge() -> LuaBridge:
     return bridge
 
 
-def bridge_call(command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Call a bridge command, converting errors to HTTP exceptions."""
-    try:
-        return get_bridge().send_command(command, params)
-    except LuaBridgeError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
+# Every confirmation-only endpoint answers with the same body
+_SUCCESS_BODY = SuccessResponse().model_dump_json().encode()
+
+
+def success() -> Response:
+    """Response for endpoints that only confirm the command ran."""
+    return Response(_SUCCESS_BODY, media_type="application/json")
+
+
+def bridge_stream(command: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    """Run a streamed bridge command and return all of its chunks.
+
+    The chunks are read before the response starts, so the bridge lock is
+    released before any bytes go to the client (a slow or vanished client
+    can't hold up other requests) and a failing command is still a 400.
+    """
+    return list(get_bridge().stream_command(command, params))
+
+
+def stream_object(chunks: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Encode chunks of one JSON object one at a time."""
+    yield b"{"
+    sep = b""
+    for chunk in chunks:
+        if chunk:
+            yield sep + orjson.dumps(chunk, option=orjson.OPT_NON_STR_KEYS)[1:-1]
+            sep = b","
+    yield b"}"
+
+
+def stream_nodes(pages: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Encode pages of nodes as one ``{"nodes": [...], "count": N}`` object."""
+    yield b'{"nodes":['
+    sep = b""
+    count = 0
+    for page in pages:
+        nodes = page.get("nodes")
+        if nodes:
+            yield sep + orjson.dumps(nodes, option=orjson.OPT_NON_STR_KEYS)[1:-1]
+            sep = b","
+            count += len(nodes)
+    yield b'],"count":%d}' % count
+
+
+# Encoded /tree/search bodies keyed by (state_version, query, max_results)
+_search_cache = LRUCache(512)
+
+# Concurrent /calc and /calc/stats requests share bridge round-trips
+_output = OutputCoalescer(get_bridge)
+
+
+# Tags ETags with this process, since state versions restart with the server
+_ETAG_EPOCH = secrets.token_hex(4)
+
+# Read endpoint name -> (bridge, state_version, encoded body)
+_read_cache: dict[str, tuple[LuaBridge, int, bytes]] = {}
+
+
+def versioned_response(request: Request, name: str, fetch: Callable[[], Any]) -> Response:
+    """Serve a read-only result that stays valid until the build changes.
+
+    The encoded body is reused while the bridge's state_version holds, and
+    the version doubles as a weak ETag so pollers sending If-None-Match get
+    a bodiless 304 instead.
+    """
+    b = get_bridge()
+    version = b.state_version
+    etag = f'W/"{_ETAG_EPOCH}-{version}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = _read_cache.get(name)
+    if cached is not None and cached[0] is b and cached[1] == version:
+        body = cached[2]
+    else:
+        body = orjson.dumps(fetch(), option=orjson.OPT_NON_STR_KEYS)
+        _read_cache[name] = (b, version, body)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @asynccontextmanager
@@ -76,8 +159,17 @@ app = FastAPI(
     description="REST API for the Path of Building PoE2 calculation engine",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Full calc output, node lists and build XML compress several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+@app.exception_handler(LuaBridgeError)
+async def lua_bridge_error_handler(request: Request, exc: LuaBridgeError):
+    return ORJSONResponse({"detail": str(exc)}, status_code=400)
+
 
 # ============================================================================
 # Health
@@ -95,231 +187,264 @@ async def health():
 # Build endpoints
 # ============================================================================
 
-@app.post("/build/new", response_model=SuccessResponse)
-async def new_build():
-    bridge_call("new_build")
-    return SuccessResponse()
+@app.post("/build/new", response_model=None, responses={200: {"model": SuccessResponse}})
+def new_build():
+    get_bridge().send_void("new_build")
+    return success()
 
 
-@app.post("/build/load/xml", response_model=SuccessResponse)
-async def load_build_xml(req: LoadBuildXmlRequest):
-    bridge_call("load_build_xml", {"xml": req.xml, "name": req.name})
-    return SuccessResponse()
+@app.post(
+    "/build/load/xml",
+    response_model=None,
+    responses={200: {"model": SuccessResponse}},
+    openapi_extra=openapi_body(LoadBuildXmlRequest),
+)
+def load_build_xml(req: LoadBuildXmlRequest = msgspec_body(LoadBuildXmlRequest)):
+    with get_bridge().xml_handoff(req.xml) as xml_params:
+        get_bridge().send_void("load_build_xml", xml_params, name=req.name)
+    return success()
 
 
-@app.get("/build/info", response_model=BuildInfo)
-async def get_build_info():
-    result = bridge_call("get_build_info")
-    return BuildInfo(**result)
+@app.get("/build/info", response_model=None, responses={200: {"model": BuildInfo}})
+def get_build_info(request: Request):
+    return versioned_response(request, "build_info", lambda: get_bridge().send_command("get_build_info"))
 
 
-@app.get("/build/export/xml", response_model=BuildXmlResponse)
-async def export_build_xml():
-    result = bridge_call("get_build_xml")
-    return BuildXmlResponse(xml=result["xml"])
+@app.get("/build/export/xml", response_model=None, responses={200: {"model": BuildXmlResponse}})
+def export_build_xml(request: Request):
+    return versioned_response(request, "build_xml", lambda: {"xml": get_bridge().export_build_xml()})
 
 
 # ============================================================================
 # Tree endpoints
 # ============================================================================
 
-@app.get("/tree/nodes", response_model=dict)
-async def list_alloc_nodes():
-    return bridge_call("list_alloc_nodes")
+@app.get("/tree/nodes", response_model=None)
+def list_alloc_nodes():
+    pages = bridge_stream("list_alloc_nodes_stream")
+    return StreamingResponse(stream_nodes(pages), media_type="application/json")
 
 
-@app.get("/tree/node/{node_id}", response_model=NodeInfo)
-async def get_node_info(node_id: int):
-    result = bridge_call("get_node_info", {"node_id": node_id})
-    return NodeInfo(**result)
+@app.get("/tree/node/{node_id}", response_model=None, responses={200: {"model": NodeInfo}})
+def get_node_info(node_id: int):
+    return ORJSONResponse(get_bridge().send_command("get_node_info", node_id=node_id))
 
 
-@app.post("/tree/node/{node_id}/alloc", response_model=SuccessResponse)
-async def alloc_node(node_id: int):
-    bridge_call("alloc_node", {"node_id": node_id})
-    return SuccessResponse()
+@app.post("/tree/node/{node_id}/alloc", response_model=None, responses={200: {"model": SuccessResponse}})
+def alloc_node(node_id: int):
+    get_bridge().send_void("alloc_node", node_id=node_id)
+    return success()
 
 
-@app.post("/tree/node/{node_id}/dealloc", response_model=SuccessResponse)
-async def dealloc_node(node_id: int):
-    bridge_call("dealloc_node", {"node_id": node_id})
-    return SuccessResponse()
+@app.post("/tree/node/{node_id}/dealloc", response_model=None, responses={200: {"model": SuccessResponse}})
+def dealloc_node(node_id: int):
+    get_bridge().send_void("dealloc_node", node_id=node_id)
+    return success()
 
 
-@app.get("/tree/search", response_model=SearchNodesResponse)
-async def search_nodes(
+@app.get("/tree/search", response_model=None, responses={200: {"model": SearchNodesResponse}})
+def search_nodes(
     q: str = Query(..., min_length=1),
     max_results: int = Query(50, ge=1, le=500),
 ):
-    result = bridge_call("search_nodes", {"query": q, "max_results": max_results})
-    return SearchNodesResponse(
-        nodes=[NodeSummary(**n) for n in result.get("nodes", [])],
-        count=result.get("count", 0),
-    )
+    # Matching is case-insensitive on the Lua side, and the tree only changes
+    # with the bridge's state_version, so both fold into the key
+    key = (get_bridge().state_version, q.lower(), max_results)
+    body = _search_cache.get(key)
+    if body is not None:
+        return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+    result = get_bridge().send_command("search_nodes", query=q, max_results=max_results)
+    body = orjson.dumps({
+        "nodes": result.get("nodes") or [],
+        "count": result.get("count", 0),
+    }, option=orjson.OPT_NON_STR_KEYS)
+    _search_cache.put(key, body)
+    return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
 
 
 # ============================================================================
 # Item endpoints
 # ============================================================================
 
-@app.get("/items", response_model=dict)
-async def list_items():
-    return bridge_call("list_items")
+@app.get("/items", response_model=None)
+def list_items():
+    return ORJSONResponse(get_bridge().send_command("list_items"))
 
 
-@app.get("/items/slots", response_model=dict)
-async def list_slots():
-    return bridge_call("list_slots")
+@app.get("/items/slots", response_model=None)
+def list_slots():
+    return ORJSONResponse(get_bridge().send_command("list_slots"))
 
 
-@app.post("/items/add", response_model=dict)
-async def add_item(req: AddItemRequest):
+@app.post("/items/add", response_model=None, openapi_extra=openapi_body(AddItemRequest))
+def add_item(req: AddItemRequest = msgspec_body(AddItemRequest)):
     params: dict[str, Any] = {"item_raw": req.item_raw}
     if req.slot:
         params["slot"] = req.slot
-    return bridge_call("add_item", params)
+    return ORJSONResponse(get_bridge().send_command("add_item", params))
 
 
-@app.post("/items/{item_id}/equip", response_model=SuccessResponse)
-async def equip_item(item_id: int, req: EquipItemRequest):
-    bridge_call("equip_item", {"item_id": item_id, "slot": req.slot})
-    return SuccessResponse()
+@app.post(
+    "/items/{item_id}/equip",
+    response_model=None,
+    responses={200: {"model": SuccessResponse}},
+    openapi_extra=openapi_body(EquipItemRequest),
+)
+def equip_item(item_id: int, req: EquipItemRequest = msgspec_body(EquipItemRequest)):
+    get_bridge().send_void("equip_item", item_id=item_id, slot=req.slot)
+    return success()
 
 
-@app.post("/items/slot/{slot}/unequip", response_model=SuccessResponse)
-async def unequip_slot(slot: str):
-    bridge_call("unequip_slot", {"slot": slot})
-    return SuccessResponse()
+@app.post("/items/slot/{slot}/unequip", response_model=None, responses={200: {"model": SuccessResponse}})
+def unequip_slot(slot: str):
+    get_bridge().send_void("unequip_slot", slot=slot)
+    return success()
 
 
-@app.delete("/items/{item_id}", response_model=SuccessResponse)
-async def delete_item(item_id: int):
-    bridge_call("delete_item", {"item_id": item_id})
-    return SuccessResponse()
+@app.delete("/items/{item_id}", response_model=None, responses={200: {"model": SuccessResponse}})
+def delete_item(item_id: int):
+    get_bridge().send_void("delete_item", item_id=item_id)
+    return success()
 
 
 # ============================================================================
 # Skill endpoints
 # ============================================================================
 
-@app.get("/skills", response_model=dict)
-async def list_skills():
-    return bridge_call("list_skills")
+@app.get("/skills", response_model=None)
+def list_skills():
+    return ORJSONResponse(get_bridge().send_command("list_skills"))
 
 
-@app.post("/skills/add", response_model=dict)
-async def add_skill(req: AddSkillRequest):
-    return bridge_call("add_skill", {"skill_text": req.skill_text})
+@app.post("/skills/add", response_model=None, openapi_extra=openapi_body(AddSkillRequest))
+def add_skill(req: AddSkillRequest = msgspec_body(AddSkillRequest)):
+    return ORJSONResponse(get_bridge().send_command("add_skill", skill_text=req.skill_text))
 
 
-@app.delete("/skills/{index}", response_model=SuccessResponse)
-async def remove_skill(index: int):
-    bridge_call("remove_skill", {"index": index})
-    return SuccessResponse()
+@app.delete("/skills/{index}", response_model=None, responses={200: {"model": SuccessResponse}})
+def remove_skill(index: int):
+    get_bridge().send_void("remove_skill", index=index)
+    return success()
 
 
-@app.post("/skills/main", response_model=SuccessResponse)
-async def set_main_skill(req: SetMainSkillRequest):
-    bridge_call("set_main_skill", {"index": req.index})
-    return SuccessResponse()
+@app.post(
+    "/skills/main",
+    response_model=None,
+    responses={200: {"model": SuccessResponse}},
+    openapi_extra=openapi_body(SetMainSkillRequest),
+)
+def set_main_skill(req: SetMainSkillRequest = msgspec_body(SetMainSkillRequest)):
+    get_bridge().send_void("set_main_skill", index=req.index)
+    return success()
 
 
 # ============================================================================
 # Calc endpoints
 # ============================================================================
 
-@app.get("/calc", response_model=dict)
-async def get_calc():
+@app.get("/calc", response_model=None)
+def get_calc():
     """Get curated calculation output stats."""
-    return bridge_call("get_output")
+    return ORJSONResponse(_output.get_output())
 
 
-@app.get("/calc/full", response_model=dict)
-async def get_calc_full():
-    """Get the full calculation output (large)."""
-    return bridge_call("get_full_output")
+@app.get("/calc/full", response_model=None)
+def get_calc_full():
+    """Get the full calculation output (large), encoded to the client chunk by chunk."""
+    chunks = bridge_stream("get_full_output_stream")
+    return StreamingResponse(stream_object(chunks), media_type="application/json")
 
 
-@app.get("/calc/stats", response_model=dict)
-async def get_calc_stats(keys: str = Query("", description="Comma-separated stat keys")):
+@app.get("/calc/stats", response_model=None)
+def get_calc_stats(keys: str = Query("", description="Comma-separated stat keys")):
     """Get specific stat keys from the calculation output."""
     if keys:
         stat_keys = [k.strip() for k in keys.split(",") if k.strip()]
-        return bridge_call("get_output", {"stats": stat_keys})
-    return bridge_call("get_output")
+        return ORJSONResponse(_output.get_output(stat_keys))
+    return ORJSONResponse(_output.get_output())
 
 
 # ============================================================================
 # Config endpoints
 # ============================================================================
 
-@app.post("/config", response_model=SuccessResponse)
-async def set_config(req: SetConfigRequest):
-    bridge_call("set_config", {"key": req.key, "value": req.value})
-    return SuccessResponse()
+@app.post(
+    "/config",
+    response_model=None,
+    responses={200: {"model": SuccessResponse}},
+    openapi_extra=openapi_body(SetConfigRequest),
+)
+def set_config(req: SetConfigRequest = msgspec_body(SetConfigRequest)):
+    get_bridge().send_void("set_config", key=req.key, value=req.value)
+    return success()
 
 
-@app.post("/config/custom-mods", response_model=SuccessResponse)
-async def set_custom_mods(req: SetCustomModsRequest):
-    bridge_call("set_custom_mods", {"mods": req.mods})
-    return SuccessResponse()
+@app.post(
+    "/config/custom-mods",
+    response_model=None,
+    responses={200: {"model": SuccessResponse}},
+    openapi_extra=openapi_body(SetCustomModsRequest),
+)
+def set_custom_mods(req: SetCustomModsRequest = msgspec_body(SetCustomModsRequest)):
+    get_bridge().send_void("set_custom_mods", mods=req.mods)
+    return success()
 
 
 # ============================================================================
 # File management endpoints
 # ============================================================================
 
-@app.get("/builds", response_model=dict)
-async def list_builds(sub_path: str = Query("")):
+@app.get("/builds", response_model=None)
+def list_builds(sub_path: str = Query("")):
     """List saved builds with metadata."""
-    result = bridge_call("list_builds", {"sub_path": sub_path})
-    return {
-        "builds": [BuildFileInfo(**b) for b in result.get("builds", [])],
-        "folders": [FolderInfo(**f) for f in result.get("folders", [])],
-    }
+    result = get_bridge().send_command("list_builds", sub_path=sub_path)
+    return ORJSONResponse({
+        "builds": result.get("builds") or [],
+        "folders": result.get("folders") or [],
+    })
 
 
-@app.get("/builds/path", response_model=dict)
-async def get_builds_path():
+@app.get("/builds/path", response_model=None)
+def get_builds_path():
     """Get the current builds directory path."""
-    result = bridge_call("get_builds_path")
-    return result
+    return ORJSONResponse(get_bridge().send_command("get_builds_path"))
 
 
-@app.post("/build/load/file", response_model=SuccessResponse)
-async def load_build_file(req: LoadBuildFileRequest):
+@app.post("/build/load/file", response_model=None, responses={200: {"model": SuccessResponse}})
+def load_build_file(req: LoadBuildFileRequest):
     """Load a build from a file path."""
-    bridge_call("load_build_file", {"path": req.path})
-    return SuccessResponse()
+    get_bridge().send_void("load_build_file", path=req.path)
+    return success()
 
 
-@app.post("/build/save", response_model=SuccessResponse)
-async def save_build():
+@app.post("/build/save", response_model=None, responses={200: {"model": SuccessResponse}})
+def save_build():
     """Save the current build to its existing file."""
-    bridge_call("save_build")
-    return SuccessResponse()
+    get_bridge().send_void("save_build")
+    return success()
 
 
-@app.post("/build/save-as", response_model=dict)
-async def save_build_as(req: SaveBuildAsRequest):
+@app.post("/build/save-as", response_model=None)
+def save_build_as(req: SaveBuildAsRequest):
     """Save the current build to a new file."""
-    return bridge_call("save_build_as", {"name": req.name, "sub_path": req.sub_path})
+    return ORJSONResponse(get_bridge().send_command("save_build_as", name=req.name, sub_path=req.sub_path))
 
 
-@app.delete("/builds/file", response_model=SuccessResponse)
-async def delete_build_file(req: DeleteBuildFileRequest):
+@app.delete("/builds/file", response_model=None, responses={200: {"model": SuccessResponse}})
+def delete_build_file(req: DeleteBuildFileRequest):
     """Delete a build file."""
-    bridge_call("delete_build_file", {"path": req.path})
-    return SuccessResponse()
+    get_bridge().send_void("delete_build_file", path=req.path)
+    return success()
 
 
-@app.post("/builds/folder", response_model=dict)
-async def create_folder(req: CreateFolderRequest):
+@app.post("/builds/folder", response_model=None)
+def create_folder(req: CreateFolderRequest):
     """Create a subfolder in the builds directory."""
-    return bridge_call("create_folder", {"name": req.name, "sub_path": req.sub_path})
+    return ORJSONResponse(get_bridge().send_command("create_folder", name=req.name, sub_path=req.sub_path))
 
 
-@app.post("/builds/rename", response_model=dict)
-async def rename_build_file(req: RenameBuildFileRequest):
+@app.post("/builds/rename", response_model=None)
+def rename_build_file(req: RenameBuildFileRequest):
     """Rename a build file."""
-    return bridge_call("rename_build_file", {"old_path": req.old_path, "new_name": req.new_name})
+    result = get_bridge().send_command("rename_build_file", old_path=req.old_path, new_name=req.new_name)
+    return ORJSONResponse(result)
@@ -15,6 +15,8 @@ from typing import Any
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.applications import Starlette
 from starlette.routing import Mount
 
@@ -62,6 +64,7 @@ def _build_rest_app() -> FastAPI:
         description="REST endpoints for the Chrome extension sidecar",
         version="0.1.0",
         docs_url="/docs",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS — Chrome extensions send chrome-extension:// origin.
@@ -73,6 +76,9 @@ def _build_rest_app() -> FastAPI:
         allow_headers=["Authorization", "Content-Type"],
     )
 
+    # Build XML, item lists and impact reports are verbose JSON
+    api.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # ------------------------------------------------------------------
     # Health — intentionally exempt from bearer-token auth so the
     # extension can probe the server before the user has entered a token.
@@ -116,7 +122,10 @@ def _build_rest_app() -> FastAPI:
 
     @api.get("/build/xml")
     def build_xml():
-        return _call("get_build_xml")
+        try:
+            return {"xml": get_pool().export_build_xml()}
+        except LuaBridgeError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
     @api.post("/build/load/xml")
     def load_build_xml(body: dict):
@@ -17,8 +17,16 @@ def main():
     parser.add_argument("--host", default=DEFAULT_HOST, help=f"Host to bind to (default: {DEFAULT_HOST})")
     parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to bind to (default: {DEFAULT_PORT})")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (default: 1); each runs its own bridge with its own loaded build",
+    )
     parser.add_argument("--log-level", default="info", choices=["debug", "info", "warning", "error"])
     args = parser.parse_args()
+    if args.reload and args.workers > 1:
+        parser.error("--reload can't be combined with --workers")
 
     logging.basicConfig(
         level=getattr(logging, args.log_level.upper()),
@@ -31,6 +39,7 @@ def main():
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
         log_level=args.log_level,
     )
 
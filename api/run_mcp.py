@@ -35,7 +35,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from api.python.mcp_server import run_server
 
-if __name__ == "__main__":
+def main():
+    # Deferred so importing this module doesn't pull in the MCP/FastAPI stack
+    from api.python.mcp_server import run_server
+
     run_server()
+
+
+if __name__ == "__main__":
+    main()
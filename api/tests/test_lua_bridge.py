@@ -0,0 +1,69 @@
+"""Tests for LuaBridge response handling that don't need a LuaJIT process."""
+
+import pytest
+
+from api.python.lua_bridge import LuaBridge, LuaBridgeError
+
+
+def scripted_bridge(responses):
+    """A bridge whose responses come from ``responses`` instead of a subprocess.
+
+    Each entry is a response dict or an exception to raise in its place.
+    Returns the bridge and a list recording every read.
+    """
+    bridge = LuaBridge(pob_path="/nonexistent")
+    bridge._started = True
+    responses = iter(responses)
+    reads = []
+
+    def read_response(command, timeout):
+        reads.append(command)
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    bridge._write_request_locked = lambda command, params, options=None: None
+    bridge._read_response_locked = read_response
+    return bridge, reads
+
+
+def test_stream_error_as_first_frame_ends_stream():
+    bridge, reads = scripted_bridge([LuaBridgeError("No build loaded")])
+
+    with pytest.raises(LuaBridgeError, match="No build loaded"):
+        list(bridge.stream_command("get_full_output_stream", timeout=1))
+
+    # The error frame is the stream's final response; nothing is drained
+    assert reads == ["get_full_output_stream"]
+    assert not bridge.is_busy
+
+
+def test_stream_error_after_chunks_ends_stream():
+    bridge, reads = scripted_bridge([
+        {"ok": True, "chunk": {"Life": 100}},
+        LuaBridgeError("boom"),
+    ])
+
+    chunks = bridge.stream_command("get_full_output_stream", timeout=1)
+    assert next(chunks) == {"Life": 100}
+    with pytest.raises(LuaBridgeError, match="boom"):
+        next(chunks)
+
+    assert len(reads) == 2
+    assert not bridge.is_busy
+
+
+def test_stream_closed_early_drains_remaining_chunks():
+    bridge, reads = scripted_bridge([
+        {"ok": True, "chunk": {"a": 1}},
+        {"ok": True, "chunk": {"b": 2}},
+        {"ok": True, "result": {"chunks": 2}},
+    ])
+
+    chunks = bridge.stream_command("get_full_output_stream", timeout=1)
+    assert next(chunks) == {"a": 1}
+    chunks.close()
+
+    assert len(reads) == 3
+    assert not bridge.is_busy